@@ -6,3 +6,6 @@ class CategoriesConfig(AppConfig):
     name = 'myproject.apps.categories'
     verbose_name = _('Category')
     verbose_name_plural = _('Categories')
+
+    def ready(self):
+        from . import signals
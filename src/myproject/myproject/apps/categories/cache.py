@@ -0,0 +1,62 @@
+import threading
+import time
+
+from django.conf import settings
+
+from myproject.apps.core.cache import bump_generation, get_generation
+
+CATEGORIES_GENERATION = 'categories'
+
+# How often (in seconds) a worker checks the shared generation number
+GENERATION_CHECK_INTERVAL = getattr(
+    settings, 'CATEGORIES_GENERATION_CHECK_INTERVAL', 1
+)
+
+_lock = threading.Lock()
+_state = {
+    'generation': None,
+    'checked_at': 0,
+    'titles': {}
+}
+
+
+def load_title_map():
+    """
+    Returns a dictionary of {(category_id, lang_code): title}
+    for all categories and languages.
+    """
+    from .models import Category, CategoryTranslations
+
+    titles = {}
+    for pk, title in Category.objects.values_list('pk', 'title'):
+        for lang_code, lang_name in settings.LANGUAGES:
+            titles[(pk, lang_code)] = title
+    translations = CategoryTranslations.objects.values_list(
+        'category_id', 'language', 'title'
+    )
+    for category_id, lang_code, title in translations:
+        titles[(category_id, lang_code)] = title
+    return titles
+
+
+def get_title_map():
+    now = time.monotonic()
+    if now - _state['checked_at'] < GENERATION_CHECK_INTERVAL:
+        return _state['titles']
+    with _lock:
+        generation = get_generation(CATEGORIES_GENERATION)
+        if generation != _state['generation']:
+            _state['titles'] = load_title_map()
+            _state['generation'] = generation
+        _state['checked_at'] = now
+    return _state['titles']
+
+
+def get_translated_title(category_id, lang_code):
+    return get_title_map().get((category_id, lang_code))
+
+
+def invalidate_title_map():
+    bump_generation(CATEGORIES_GENERATION)
+    # This worker doesn't need to wait for the next check
+    _state['checked_at'] = 0
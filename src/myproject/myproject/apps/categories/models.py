@@ -1,7 +1,34 @@
+from django.conf import settings
 from django.db import models
+from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 
-from myproject.apps.core.model_field import TranslatedField
+from myproject.apps.core.model_field import (
+    TranslatedField,
+    TranslatedQuerySet
+)
+
+
+class CachedTranslatedField(TranslatedField):
+    """
+    TranslatedField reading the category titles of the other
+    languages than the default one from the process-local title
+    map instead of the database.
+    """
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        from .cache import get_translated_title
+        lang_code = translation.get_language()
+        title = None
+        # The title of the default language is in the instance,
+        # including unsaved changes
+        if instance.pk and lang_code != settings.LANGUAGE_CODE:
+            title = get_translated_title(instance.pk, lang_code)
+        if title is None:
+            title = super().__get__(instance, owner)
+        return title
 
 
 class Category(models.Model):
@@ -9,9 +36,11 @@ class Category(models.Model):
         _('Title'),
         max_length=200
     )
-    translated_title = TranslatedField('title')
+    translated_title = CachedTranslatedField('title')
     slug = models.SlugField()
 
+    objects = TranslatedQuerySet.as_manager()
+
     class Meta:
         verbose_name = _('Category')
         verbose_name_plural = _('Categories')
@@ -0,0 +1,16 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_title_map
+from .models import Category, CategoryTranslations
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=CategoryTranslations)
+@receiver(post_delete, sender=CategoryTranslations)
+def category_changed_handler(sender, **kwargs):
+    # Titles loaded before the commit would be kept
+    # until the next change of the categories
+    transaction.on_commit(invalidate_title_map)
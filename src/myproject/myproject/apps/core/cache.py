@@ -0,0 +1,46 @@
+import time
+
+from django.core.cache import cache
+from django.utils.timezone import now as timezone_now
+
+
+def generation_key(name):
+    return f'generation:{name}'
+
+
+def get_generation(name):
+    """
+    Returns the current generation number for the named
+    group of cached data.
+    """
+    key = generation_key(name)
+    generation = cache.get(key)
+    if generation is None:
+        # Start from a time based number, so that a generation that
+        # was evicted from the cache never matches an older one.
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(name):
+    """
+    Invalidates everything cached for the named group of data
+    by moving to the next generation number.
+    """
+    key = generation_key(name)
+    get_generation(name)
+    cache.set(f'{key}:changed_at', timezone_now(), timeout=None)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # The key was evicted in the meantime
+        return get_generation(name)
+
+
+def get_generation_changed_at(name):
+    """
+    Returns the date and time when the named group of data
+    was last invalidated, or None if it is not known.
+    """
+    return cache.get(f'{generation_key(name)}:changed_at')
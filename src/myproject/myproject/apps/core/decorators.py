@@ -0,0 +1,55 @@
+import hashlib
+from functools import wraps
+
+from django.core.cache import cache
+from django.utils.translation import get_language
+
+from .cache import get_generation
+
+
+def get_normalized_query(request):
+    """
+    Returns the query string with sorted parameters and values.
+    """
+    return '&'.join(
+        f'{key}={value}'
+        for key, value_list in sorted(request.GET.lists())
+        for value in sorted(value_list)
+    )
+
+
+def get_page_cache_key(request, generation):
+    url_hash = hashlib.md5(
+        f'{request.path}?{get_normalized_query(request)}'.encode()
+    ).hexdigest()
+    return 'page:{}:{}:{}:{}'.format(
+        generation,
+        get_generation(generation),
+        get_language(),
+        url_hash
+    )
+
+
+def cache_page_per_generation(generation, timeout=None):
+    """
+    Caches the responses of a view for anonymous GET requests per
+    language, path and sorted query parameters, until the named
+    generation changes or the timeout passes.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            if (request.method not in ('GET', 'HEAD')
+                    or request.user.is_authenticated):
+                return view_func(request, *args, **kwargs)
+            cache_key = get_page_cache_key(request, generation)
+            response = cache.get(cache_key)
+            if response is None:
+                response = view_func(request, *args, **kwargs)
+                if (response.status_code == 200
+                        and not response.streaming
+                        and not response.cookies):
+                    cache.set(cache_key, response, timeout)
+            return response
+        return _wrapped_view
+    return decorator
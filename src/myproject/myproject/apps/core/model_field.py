@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.utils.translation import get_language
 from django.utils import translation
 
@@ -51,13 +52,18 @@ class MultilingialField(models.Field):
                             virtual_only=False):
         def translated_value(self):
             language = get_language()
-            val = self.__dict__.get(
+            # getattr() loads the value if the column was deferred
+            # by MultilingualQuerySet.for_language()
+            val = getattr(
+                self,
                 MultilingialField.localized_field_name(
                     name, language
-                )
+                ),
+                None
             )
             if not val:
-                val = self.__dict__.get(
+                val = getattr(
+                    self,
                     MultilingialField.localized_field_name(
                         name, settings.LANGUAGE_CODE
                     )
@@ -67,6 +73,9 @@ class MultilingialField(models.Field):
         # generate language-specific fields dynamically
         if not cls._meta.abstract:
             if self.localized_field_model:
+                if '_multilingual_field_names' not in cls.__dict__:
+                    cls._multilingual_field_names = []
+                cls._multilingual_field_names.append(name)
                 for lang_code, lang_name in settings.LANGUAGES:
                     localized_field = self.get_localized_field(
                         lang_code, lang_name
@@ -164,6 +173,30 @@ class MultilingualField(models.Field):
 
 
 
+class MultilingualQuerySet(models.QuerySet):
+    """
+    QuerySet for models with MultilingualCharField and
+    MultilingualTextField fields.
+    """
+
+    def for_language(self, lang_code=None):
+        """
+        Defers the localized columns of all languages except the
+        given (or active) one and the default one.
+        """
+        lang_code = lang_code or get_language()
+        loaded_lang_codes = {lang_code, settings.LANGUAGE_CODE}
+        deferred_fields = [
+            MultilingialField.localized_field_name(name, code)
+            for name in getattr(
+                self.model, '_multilingual_field_names', []
+            )
+            for code, lang_name in settings.LANGUAGES
+            if code not in loaded_lang_codes
+        ]
+        return self.defer(*deferred_fields)
+
+
 class MultilingualCharField(models.CharField, MultilingialField):
     pass
 
@@ -176,7 +209,54 @@ class TranslatedField(object):
     def __init__(self, field_name):
         self.field_name = field_name
 
+    @staticmethod
+    def prefetch_to_attr(lang_code):
+        lang_code_safe = lang_code.replace('-', '_')
+        return f'_translations_{lang_code_safe}'
+
+    @staticmethod
+    def get_translation(instance, lang_code):
+        # Translations loaded by TranslatedQuerySet.with_translations()
+        prefetched = getattr(
+            instance, TranslatedField.prefetch_to_attr(lang_code), None
+        )
+        if prefetched is not None:
+            return prefetched[0] if prefetched else None
+        # Translations loaded by prefetch_related('translations')
+        prefetched_objects = getattr(
+            instance, '_prefetched_objects_cache', {}
+        )
+        if 'translations' in prefetched_objects:
+            for item in prefetched_objects['translations']:
+                if item.language == lang_code:
+                    return item
+            return None
+        # Translations memoized per instance and language
+        memo = instance.__dict__.setdefault('_translations_memo', {})
+        if lang_code not in memo:
+            memo[lang_code] = instance.translations.filter(
+                language=lang_code,
+            ).first()
+        return memo[lang_code]
+
+    @staticmethod
+    def clear_translations(instance):
+        """
+        Forgets the memoized and prefetched translations of the
+        instance, e.g. after one of its translations was changed.
+        """
+        instance.__dict__.pop('_translations_memo', None)
+        prefix = TranslatedField.prefetch_to_attr('')
+        for attr in list(instance.__dict__):
+            if attr.startswith(prefix):
+                del instance.__dict__[attr]
+        getattr(instance, '_prefetched_objects_cache', {}).pop(
+            'translations', None
+        )
+
     def __get__(self, instance, owner):
+        if instance is None:
+            return self
         lang_code = translation.get_language()
         if lang_code == settings.LANGUAGE_CODE:
             # The fielfs of the default language are in the main model
@@ -184,7 +264,59 @@ class TranslatedField(object):
         else:
             # The fields of the other languages are in the translation
             # model, but falls back to the main model
-            translations = instance.translations.filter(
-                language=lang_code,
-            ).first() or instance
+            translations = TranslatedField.get_translation(
+                instance, lang_code
+            ) or instance
             return getattr(translations, self.field_name)
+
+
+class TranslatedQuerySet(models.QuerySet):
+    """
+    QuerySet for models with TranslatedField attributes and
+    a translations model related as "translations".
+    """
+
+    def with_translations(self, lang_code=None):
+        """
+        Loads the translations of the given (or active) language
+        with one batched query, so that TranslatedField doesn't
+        query the database for each instance.
+        """
+        lang_code = lang_code or translation.get_language()
+        if not lang_code or lang_code == settings.LANGUAGE_CODE:
+            return self
+        translations_model = self.model._meta.get_field(
+            'translations'
+        ).related_model
+        return self.prefetch_related(
+            models.Prefetch(
+                'translations',
+                queryset=translations_model.objects.filter(
+                    language=lang_code
+                ),
+                to_attr=TranslatedField.prefetch_to_attr(lang_code)
+            )
+        )
+
+    def annotate_translated(self, field_name, lang_code=None, alias=None):
+        """
+        Annotates the translated value of the field in the given (or
+        active) language, falling back to the value of the main model.
+        The annotation, by default named "translated_<field_name>",
+        can be used for ordering and filtering. It replaces the
+        TranslatedField of the same name on the instances.
+        """
+        lang_code = lang_code or translation.get_language()
+        alias = alias or f'translated_{field_name}'
+        if not lang_code or lang_code == settings.LANGUAGE_CODE:
+            return self.annotate(**{alias: models.F(field_name)})
+        translations_relation = self.model._meta.get_field('translations')
+        translations = translations_relation.related_model.objects.filter(
+            **{
+                translations_relation.field.name: models.OuterRef('pk'),
+                'language': lang_code
+            }
+        ).values(field_name)[:1]
+        return self.annotate(
+            **{alias: Coalesce(models.Subquery(translations), field_name)}
+        )
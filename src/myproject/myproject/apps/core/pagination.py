@@ -0,0 +1,249 @@
+import base64
+import binascii
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.core.paginator import (
+    EmptyPage,
+    InvalidPage,
+    PageNotAnInteger,
+    Paginator
+)
+from django.db import connections, models
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+
+from .cache import get_generation
+
+
+class InvalidCursor(InvalidPage):
+    pass
+
+
+class CursorPage(object):
+    """
+    A page of a CursorPaginator. It has no page number: the next page
+    is requested with next_cursor.
+    """
+    is_cursor_page = True
+
+    def __init__(self, object_list, cursor, next_cursor, paginator):
+        self.object_list = object_list
+        self.cursor = cursor
+        self.next_cursor = next_cursor
+        self.paginator = paginator
+
+    def __repr__(self):
+        return f'<Page after {self.cursor or "start"}>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return bool(self.cursor)
+
+    def has_other_pages(self):
+        return self.has_previous() or self.has_next()
+
+
+class CursorPaginator(object):
+    """
+    Keyset paginator: instead of an OFFSET, each page continues after
+    the ordering values of the last object of the previous page,
+    which are encoded in an opaque cursor. The ordering must be
+    unique, e.g. ('-created', '-pk'), and should be backed by an index.
+    """
+
+    def __init__(self, object_list, per_page, ordering):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.ordering = ordering
+        self.model = object_list.model
+
+    def get_ordering_field(self, name):
+        name = name.lstrip('-')
+        if name == 'pk':
+            return self.model._meta.pk
+        return self.model._meta.get_field(name)
+
+    def encode_cursor(self, obj):
+        values = [
+            self.get_ordering_field(name).value_to_string(obj)
+            for name in self.ordering
+        ]
+        return base64.urlsafe_b64encode(
+            json.dumps(values).encode()
+        ).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                self.get_ordering_field(name).to_python(value)
+                for name, value in zip(self.ordering, values)
+            ]
+        except (binascii.Error, TypeError, ValueError, ValidationError):
+            raise InvalidCursor('That cursor is not valid')
+
+    def get_cursor_filter(self, values):
+        """
+        Returns a condition for the objects following the values, e.g.
+        created < c OR (created = c AND pk < p) for ('-created', '-pk').
+        """
+        condition = models.Q()
+        equal_lookups = {}
+        for name, value in zip(self.ordering, values):
+            lookup = 'lt' if name.startswith('-') else 'gt'
+            name = name.lstrip('-')
+            condition |= models.Q(
+                **equal_lookups, **{f'{name}__{lookup}': value}
+            )
+            equal_lookups[name] = value
+        return condition
+
+    def page(self, cursor=None):
+        qs = self.object_list.order_by(*self.ordering)
+        if cursor:
+            qs = qs.filter(self.get_cursor_filter(self.decode_cursor(cursor)))
+        # one more object tells whether there is a next page
+        object_list = list(qs[:self.per_page + 1])
+        next_cursor = None
+        if len(object_list) > self.per_page:
+            object_list = object_list[:self.per_page]
+            next_cursor = self.encode_cursor(object_list[-1])
+        return CursorPage(object_list, cursor, next_cursor, self)
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator caching the count of its queryset per generation of the
+    named data and for cache_timeout seconds. On PostgreSQL, the
+    planner estimate is used instead of an exact count when it is
+    above estimate_threshold; then is_estimated is True and the page
+    numbers are checked against the rows of the requested page, which
+    correct the estimate.
+    """
+
+    def __init__(self, object_list, per_page, generation,
+                 cache_timeout=300, estimate_threshold=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.generation = generation
+        self.cache_timeout = cache_timeout
+        self.estimate_threshold = estimate_threshold
+
+    def get_cache_key(self):
+        try:
+            query = str(self.object_list.query)
+        except EmptyResultSet:
+            # e.g. filtered by an empty list; all of them count 0
+            query = ''
+        query_hash = hashlib.md5(query.encode()).hexdigest()
+        return 'paginator_count:{}:{}:{}'.format(
+            self.generation,
+            get_generation(self.generation),
+            query_hash
+        )
+
+    def get_estimated_count(self):
+        """
+        Returns the number of rows estimated by the PostgreSQL planner,
+        or None when it can't be read, so that the rows are counted.
+        """
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return None
+        try:
+            sql, params = self.object_list.query.sql_with_params()
+        except EmptyResultSet:
+            return None
+        with connection.cursor() as cursor:
+            # QuerySet.explain() would turn the decoded JSON into a repr
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            row = cursor.fetchone()
+        try:
+            plan = row[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]['Plan']['Plan Rows'])
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
+
+    @cached_property
+    def count_and_estimation(self):
+        cache_key = self.get_cache_key()
+        count_and_estimation = cache.get(cache_key)
+        if count_and_estimation is None:
+            estimated_count = None
+            if self.estimate_threshold is not None:
+                estimated_count = self.get_estimated_count()
+            if (estimated_count is not None
+                    and estimated_count > self.estimate_threshold):
+                count_and_estimation = (estimated_count, True)
+            else:
+                count_and_estimation = (self.object_list.count(), False)
+            cache.set(cache_key, count_and_estimation, self.cache_timeout)
+        return count_and_estimation
+
+    @cached_property
+    def count(self):
+        return self.count_and_estimation[0]
+
+    @property
+    def is_estimated(self):
+        return self.count_and_estimation[1]
+
+    def set_count(self, count, is_estimated):
+        self.__dict__['count_and_estimation'] = (count, is_estimated)
+        self.__dict__['count'] = count
+        self.__dict__.pop('num_pages', None)
+        if not is_estimated:
+            cache.set(self.get_cache_key(), (count, False), self.cache_timeout)
+
+    def validate_number(self, number):
+        if not self.is_estimated:
+            return super().validate_number(number)
+        # the estimated count can be too high or too low, so page()
+        # checks whether the page has rows instead of num_pages
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_('That page number is not an integer'))
+        if number < 1:
+            raise EmptyPage(_('That page number is less than 1'))
+        return number
+
+    def page(self, number):
+        if not self.is_estimated:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        # one more object tells whether there is a next page
+        object_list = list(self.object_list[bottom:top + 1])
+        if not object_list and number > 1:
+            # past the last page: count the rows once, so that the
+            # last existing page can be found
+            self.set_count(self.object_list.count(), is_estimated=False)
+            raise EmptyPage(_('That page contains no results'))
+        if len(object_list) <= self.per_page:
+            # the last page tells the exact count
+            self.set_count(bottom + len(object_list), is_estimated=False)
+        elif self.count <= top:
+            # keep the next page reachable
+            self.set_count(top + 1, is_estimated=True)
+        return self._get_page(object_list[:self.per_page], number, self)
@@ -45,3 +45,26 @@ def modify_query(context, *params_to_remove, **params_to_change):
     for key, value in params_to_change.items():
         query_params.append((key, value))
     return construct_query_string(context, query_params)
+
+
+@register.simple_tag(takes_context=True)
+def toggle_query(context, *params_to_remove, **params_to_toggle):
+    '''Renders a link adding or removing values of
+    multi-valued query parameters.'''
+    query_params = []
+    for key, value_list in context['request'].GET.lists():
+        if key not in params_to_remove:
+            if key in params_to_toggle:
+                # remove the value if it is there, add it otherwise
+                value = force_str(params_to_toggle.pop(key))
+                if value in value_list:
+                    value_list = [
+                        item for item in value_list if item != value
+                    ]
+                else:
+                    value_list = value_list + [value]
+            for value in value_list:
+                query_params.append((key, value))
+    for key, value in params_to_toggle.items():
+        query_params.append((key, value))
+    return construct_query_string(context, query_params)
@@ -0,0 +1,17 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+
+
+def create_executor(max_workers):
+    """
+    Returns a pool of worker processes set up for Django.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        # a fresh interpreter doesn't share the database
+        # connections of the current process
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=django.setup
+    )
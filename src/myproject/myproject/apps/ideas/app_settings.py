@@ -0,0 +1,35 @@
+from django.conf import settings
+
+# Read the idea list and the search results from LocalizedIdea
+USE_READ_MODEL = getattr(settings, 'IDEAS_USE_READ_MODEL', False)
+# Paginate IdeaListView with ?after=<cursor> instead of ?page=<number>;
+# the cursor mode is also used whenever the "after" parameter is given
+CURSOR_PAGINATION = getattr(settings, 'IDEAS_CURSOR_PAGINATION', False)
+# Number of characters kept from the content in LocalizedIdea
+CONTENT_EXCERPT_LENGTH = getattr(
+    settings, 'IDEAS_CONTENT_EXCERPT_LENGTH', 300
+)
+# Seconds to keep the facet counts of a filter combination
+FACETS_CACHE_TIMEOUT = getattr(settings, 'IDEAS_FACETS_CACHE_TIMEOUT', 3600)
+# Seconds to keep the result count of a filter combination
+COUNT_CACHE_TIMEOUT = getattr(settings, 'IDEAS_COUNT_CACHE_TIMEOUT', 300)
+# Above this number of rows estimated by PostgreSQL, the estimate is shown
+# instead of an exact count; None to always count
+COUNT_ESTIMATE_THRESHOLD = getattr(
+    settings, 'IDEAS_COUNT_ESTIMATE_THRESHOLD', 10000
+)
+# Seconds to keep a rendered idea list page for anonymous visitors
+PAGE_CACHE_TIMEOUT = getattr(settings, 'IDEAS_PAGE_CACHE_TIMEOUT', 3600)
+# Generate the picture renditions in background worker processes
+# when a picture is uploaded, showing a placeholder until they are ready,
+# instead of generating them on first access
+PREGENERATE_PICTURES = getattr(settings, 'IDEAS_PREGENERATE_PICTURES', True)
+# Number of worker processes generating picture renditions per web worker
+PICTURE_WORKERS = getattr(settings, 'IDEAS_PICTURE_WORKERS', 1)
+# Store the uploaded pictures under the SHA-256 of their content,
+# so that ideas with the same picture share the file and its renditions
+CONTENT_ADDRESSED_PICTURES = getattr(
+    settings, 'IDEAS_CONTENT_ADDRESSED_PICTURES', False
+)
+# Number of queued media files deleted per batch in the background
+MEDIA_PURGE_BATCH_SIZE = getattr(settings, 'IDEAS_MEDIA_PURGE_BATCH_SIZE', 100)
@@ -5,3 +5,6 @@ from django.utils.translation import gettext_lazy as _
 class IdeasAppConfig(AppConfig):
     name = 'myproject.apps.ideas'
     verbose_name = _('Ideas')
+
+    def ready(self):
+        from . import signals
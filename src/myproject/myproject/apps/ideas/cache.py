@@ -0,0 +1,19 @@
+from myproject.apps.core.cache import (
+    bump_generation,
+    get_generation,
+    get_generation_changed_at
+)
+
+IDEAS_GENERATION = 'ideas'
+
+
+def get_ideas_generation():
+    return get_generation(IDEAS_GENERATION)
+
+
+def get_ideas_changed_at():
+    return get_generation_changed_at(IDEAS_GENERATION)
+
+
+def invalidate_ideas():
+    bump_generation(IDEAS_GENERATION)
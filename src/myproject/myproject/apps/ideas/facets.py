@@ -0,0 +1,183 @@
+from collections import namedtuple
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import models
+from django.utils.translation import get_language
+
+from myproject.apps.categories.cache import CATEGORIES_GENERATION
+from myproject.apps.categories.models import Category
+from myproject.apps.core.cache import get_generation
+from .app_settings import FACETS_CACHE_TIMEOUT
+from .cache import get_ideas_generation
+from .models import IdeaWithTranslatedFields, RATING_CHOICES
+
+User = get_user_model()
+
+FacetValue = namedtuple('FacetValue', ['pk', 'label', 'count'])
+
+FACETS = (
+    # query parameter, filter parameter, facets key
+    ('author', 'author', 'authors'),
+    ('category', 'categories', 'categories'),
+    ('rating', 'rating', 'ratings'),
+)
+
+# Facets whose values can be combined with OR or AND
+MULTIPLE_CHOICE_FACETS = ('category',)
+
+OR, AND = 'or', 'and'
+
+
+def normalize_selection(cleaned_data):
+    """
+    Returns {query parameter: primary key or sorted primary keys} of
+    the selected facet values, and the "category_op" operator when
+    more than one category is selected.
+    """
+    selection = {}
+    for query_param, filter_param, key in FACETS:
+        value = cleaned_data.get(query_param)
+        if query_param in MULTIPLE_CHOICE_FACETS:
+            if value:
+                selection[query_param] = sorted(
+                    int(getattr(item, 'pk', item)) for item in value
+                )
+                if len(value) > 1:
+                    selection[f'{query_param}_op'] = (
+                        cleaned_data.get(f'{query_param}_op') or OR
+                    )
+        elif value:
+            selection[query_param] = int(getattr(value, 'pk', value))
+    return selection
+
+
+def get_category_conditions(category_pks, operator, idea_ref):
+    """
+    Returns EXISTS conditions for ideas in any (OR) or in all (AND)
+    of the categories. Unlike joins, they never repeat idea rows,
+    so no DISTINCT is needed.
+    """
+    through_model = IdeaWithTranslatedFields.categories.through
+    if operator == AND:
+        category_sets = [[category_pk] for category_pk in category_pks]
+    else:
+        category_sets = [category_pks]
+    return [
+        models.Exists(
+            through_model.objects.filter(
+                ideawithtranslatedfields=idea_ref,
+                category__in=category_set
+            )
+        )
+        for category_set in category_sets
+    ]
+
+
+def get_filter_conditions(selection, idea_field='pk', exclude=None):
+    """
+    Returns a Q object for the normalized selection. idea_field is the
+    path to the idea primary key in the filtered model.
+    """
+    conditions = models.Q()
+    for query_param, filter_param, key in FACETS:
+        if query_param == exclude or query_param not in selection:
+            continue
+        if query_param == 'category':
+            for condition in get_category_conditions(
+                selection['category'],
+                selection.get('category_op', OR),
+                models.OuterRef(idea_field)
+            ):
+                conditions &= models.Q(condition)
+        else:
+            conditions &= models.Q(
+                **{filter_param: selection[query_param]}
+            )
+    return conditions
+
+
+def filter_ideas(qs, selection, idea_field='pk'):
+    """
+    Filters the queryset of ideas or of objects related to ideas by
+    the normalized selection.
+    """
+    return qs.filter(get_filter_conditions(selection, idea_field))
+
+
+def get_facet_choices():
+    """
+    Returns {query parameter: [(primary key, label), ...]}
+    of the values that can be selected.
+    """
+    authors = User.objects.filter(
+        authored_ideas__isnull=False
+    ).distinct().order_by('username')
+    categories = Category.objects.filter(
+        category_ideas__isnull=False
+    ).distinct().order_by('title')
+    return {
+        'author': [(author.pk, str(author)) for author in authors],
+        'category': [
+            (category.pk, category.translated_title)
+            for category in categories
+        ],
+        'rating': list(RATING_CHOICES)
+    }
+
+
+def count_facets(selection):
+    """
+    Returns {query parameter: {primary key: count}} with the numbers of
+    ideas for each facet value under the selected values of the other
+    facets, with one grouped query per facet.
+    """
+    counts = {}
+    for query_param, filter_param, key in FACETS:
+        counts[query_param] = dict(
+            IdeaWithTranslatedFields.objects.filter(
+                get_filter_conditions(selection, exclude=query_param)
+            ).values_list(filter_param).annotate(
+                count=models.Count('pk')
+            ).order_by()
+        )
+    return counts
+
+
+def is_selected(selection, query_param, pk):
+    value = selection.get(query_param)
+    if query_param in MULTIPLE_CHOICE_FACETS:
+        return pk in (value or [])
+    return value == pk
+
+
+def get_facets(selection):
+    """
+    Returns {facets key: [FacetValue, ...]} for the normalized
+    selection, cached per language and selection until the ideas,
+    their authors or the categories change. Values without ideas are
+    left out unless they are selected.
+    """
+    cache_key = 'idea_facets:{}:{}:{}:{}'.format(
+        get_ideas_generation(),
+        get_generation(CATEGORIES_GENERATION),
+        get_language(),
+        '&'.join(
+            f'{query_param}={value}'.replace(' ', '')
+            for query_param, value in sorted(selection.items())
+        )
+    )
+    facets = cache.get(cache_key)
+    if facets is None:
+        choices = get_facet_choices()
+        counts = count_facets(selection)
+        facets = {}
+        for query_param, filter_param, key in FACETS:
+            facets[key] = [
+                FacetValue(pk, label, counts[query_param].get(pk, 0))
+                for pk, label in choices[query_param]
+                if pk in counts[query_param]
+                or is_selected(selection, query_param, pk)
+            ]
+        cache.set(cache_key, facets, FACETS_CACHE_TIMEOUT)
+    return facets
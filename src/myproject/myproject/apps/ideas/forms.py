@@ -1,7 +1,6 @@
 from django import forms
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from crispy_forms import bootstrap, helper, layout
@@ -150,16 +149,24 @@ class IdeaFilterForm(forms.Form):
     author = forms.ModelChoiceField(
         label=_('Author'),
         required=False,
-        queryset=User.objects.annotate(
-            idea_count=models.Count('authored_ideas')
-        ).filter(idea_count__gt=0)
+        queryset=User.objects.filter(
+            authored_ideas__isnull=False
+        ).distinct()
     )
-    category = forms.ModelChoiceField(
+    category = forms.ModelMultipleChoiceField(
         label=_('Category'),
         required=False,
-        queryset=Category.objects.annotate(
-            idea_count=models.Count('category_ideas')
-        ).filter(idea_count__gt=0)
+        queryset=Category.objects.filter(
+            category_ideas__isnull=False
+        ).distinct()
+    )
+    category_op = forms.ChoiceField(
+        label=_('Categories to match'),
+        required=False,
+        choices=(
+            ('or', _('Any')),
+            ('and', _('All'))
+        )
     )
     rating = forms.ChoiceField(
         label=_('Rating'),
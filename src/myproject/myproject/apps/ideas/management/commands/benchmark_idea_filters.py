@@ -0,0 +1,140 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from myproject.apps.categories.models import Category
+from myproject.apps.ideas.facets import AND, OR, filter_ideas
+from myproject.apps.ideas.models import IdeaWithTranslatedFields
+
+BENCHMARK_TITLE_PREFIX = 'Benchmark idea'
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares the JOIN + DISTINCT category filtering with the '
+        'EXISTS based one on the ideas in the database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Number of benchmark ideas to create first, e.g. 1000000.'
+        )
+        parser.add_argument(
+            '--categories',
+            type=int,
+            default=20,
+            help='Number of categories to spread the seeded ideas over.'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Number of timed runs of each query.'
+        )
+        parser.add_argument(
+            '--cleanup',
+            action='store_true',
+            help='Delete the seeded benchmark ideas and exit.'
+        )
+
+    def handle(self, *args, **options):
+        if options['cleanup']:
+            deleted, details = IdeaWithTranslatedFields.objects.filter(
+                title__startswith=BENCHMARK_TITLE_PREFIX
+            ).delete()
+            self.stdout.write(f'Deleted {deleted} objects.')
+            return
+        if options['seed']:
+            self.seed(options['seed'], options['categories'])
+
+        category_pks = list(
+            Category.objects.order_by('pk').values_list('pk', flat=True)
+        )[:3]
+        if not category_pks:
+            self.stderr.write('There are no categories to filter by.')
+            return
+
+        qs = IdeaWithTranslatedFields.objects.order_by('-created')
+        cases = [
+            ('one category', [category_pks[0]], OR),
+            ('any of categories', category_pks, OR),
+            ('all of categories', category_pks, AND),
+        ]
+        for title, pks, operator in cases:
+            if operator == AND:
+                distinct_qs = qs
+                for pk in pks:
+                    distinct_qs = distinct_qs.filter(
+                        categories=pk
+                    ).distinct()
+            else:
+                distinct_qs = qs.filter(categories__in=pks).distinct()
+            exists_qs = filter_ideas(
+                qs, {'category': pks, 'category_op': operator}
+            )
+            for variant, variant_qs in (
+                ('JOIN + DISTINCT', distinct_qs),
+                ('EXISTS', exists_qs),
+            ):
+                page_time = self.measure(
+                    lambda: list(variant_qs[:24]), options['repeat']
+                )
+                count_time = self.measure(
+                    variant_qs.count, options['repeat']
+                )
+                self.stdout.write(
+                    f'{title:<20} {variant:<16} '
+                    f'first page: {page_time * 1000:9.1f} ms   '
+                    f'count: {count_time * 1000:9.1f} ms'
+                )
+
+    @staticmethod
+    def measure(function, repeat):
+        timings = []
+        for i in range(repeat):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+        return statistics.median(timings)
+
+    def seed(self, count, category_count, batch_size=10000):
+        categories = list(Category.objects.order_by('pk')[:category_count])
+        for index in range(len(categories), category_count):
+            categories.append(Category.objects.create(
+                title=f'Benchmark category {index}',
+                slug=f'benchmark-category-{index}'
+            ))
+        through_model = IdeaWithTranslatedFields.categories.through
+        offset = IdeaWithTranslatedFields.objects.filter(
+            title__startswith=BENCHMARK_TITLE_PREFIX
+        ).count()
+        for start in range(0, count, batch_size):
+            with transaction.atomic():
+                ideas = IdeaWithTranslatedFields.objects.bulk_create([
+                    IdeaWithTranslatedFields(
+                        title=f'{BENCHMARK_TITLE_PREFIX} {offset + index}',
+                        content=f'Content of the benchmark idea {index}',
+                        rating=random.randint(1, 5)
+                    )
+                    for index in range(start, min(start + batch_size, count))
+                ])
+                through_model.objects.bulk_create([
+                    through_model(
+                        ideawithtranslatedfields_id=idea.pk,
+                        category_id=category.pk
+                    )
+                    for idea in ideas
+                    for category in random.sample(
+                        categories,
+                        random.randint(1, min(3, len(categories)))
+                    )
+                ])
+            self.stdout.write(
+                f'Seeded {min(start + batch_size, count)}/{count} ideas'
+            )
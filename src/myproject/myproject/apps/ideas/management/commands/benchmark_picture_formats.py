@@ -0,0 +1,66 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from myproject.apps.ideas.models import (
+    PICTURE_VARIANT_SIZES,
+    IdeaWithTranslatedFields,
+    get_picture_variants
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares the byte size and encoding time of the picture specs '
+        'with their modern format variants on a sample of idea pictures.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sample',
+            type=int,
+            default=20,
+            help='Number of idea pictures to encode.'
+        )
+
+    def handle(self, *args, **options):
+        ideas = list(
+            IdeaWithTranslatedFields.objects.exclude(
+                picture=''
+            ).exclude(
+                picture=None
+            ).order_by('-created')[:options['sample']]
+        )
+        if not ideas:
+            self.stderr.write('There are no idea pictures to encode.')
+            return
+        self.stdout.write(f'{len(ideas)} pictures')
+        for spec in PICTURE_VARIANT_SIZES:
+            sizes, timings = self.measure(ideas, spec)
+            base_size = statistics.mean(sizes)
+            self.write_row(spec, sizes, timings, base_size)
+            for mime_type, variants in get_picture_variants(spec):
+                for variant_spec, width in variants:
+                    sizes, timings = self.measure(ideas, variant_spec)
+                    self.write_row(variant_spec, sizes, timings, base_size)
+
+    @staticmethod
+    def measure(ideas, spec):
+        sizes = []
+        timings = []
+        for idea in ideas:
+            generator = getattr(idea, spec).generator
+            start = time.perf_counter()
+            content = generator.generate()
+            timings.append(time.perf_counter() - start)
+            sizes.append(len(content.read()))
+        return sizes, timings
+
+    def write_row(self, spec, sizes, timings, base_size):
+        size = statistics.mean(sizes)
+        self.stdout.write(
+            f'{spec:<32} '
+            f'{size / 1024:9.1f} KB {size / base_size:7.1%}   '
+            f'{statistics.mean(timings) * 1000:8.1f} ms'
+        )
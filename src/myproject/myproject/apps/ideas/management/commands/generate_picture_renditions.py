@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+
+from myproject.apps.ideas.models import IdeaWithTranslatedFields
+from myproject.apps.ideas.pictures import (
+    resolve_picture_urls,
+    store_missing_metadata
+)
+from myproject.apps.ideas.read_model import update_localized_ideas
+
+
+class Command(BaseCommand):
+    help = (
+        'Generates the missing picture renditions of existing ideas '
+        'and stores the missing picture metadata.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=100,
+            help='Number of ideas processed at a time.'
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        idea_pks = list(
+            IdeaWithTranslatedFields.objects.exclude(
+                picture=''
+            ).exclude(
+                picture=None
+            ).order_by('pk').values_list('pk', flat=True)
+        )
+        generated_count = 0
+        for start in range(0, len(idea_pks), chunk_size):
+            ideas = IdeaWithTranslatedFields.objects.filter(
+                pk__in=idea_pks[start:start + chunk_size]
+            )
+            new_renditions = resolve_picture_urls(ideas, generate=True)
+            if new_renditions:
+                # replace the placeholders in the localized versions
+                source_names = {
+                    rendition.source_name for rendition in new_renditions
+                }
+                update_localized_ideas({
+                    idea.pk for idea in ideas
+                    if idea.picture.name in source_names
+                })
+            store_missing_metadata(ideas)
+            generated_count += len(new_renditions)
+            if options['verbosity'] > 1:
+                self.stdout.write(
+                    f'{min(start + chunk_size, len(idea_pks))}'
+                    f'/{len(idea_pks)}'
+                )
+        self.stdout.write(self.style.SUCCESS(
+            f'Registered {generated_count} picture renditions '
+            f'of {len(idea_pks)} ideas.'
+        ))
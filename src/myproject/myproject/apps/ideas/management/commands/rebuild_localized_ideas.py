@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from myproject.apps.ideas.models import IdeaWithTranslatedFields, LocalizedIdea
+from myproject.apps.ideas.read_model import update_localized_ideas
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the LocalizedIdea read model of all ideas.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of ideas rebuilt at a time.'
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        idea_pks = list(
+            IdeaWithTranslatedFields.objects.order_by(
+                'pk'
+            ).values_list('pk', flat=True)
+        )
+        # Remove the rows of ideas that don't exist anymore
+        LocalizedIdea.objects.exclude(idea__in=idea_pks).delete()
+        for start in range(0, len(idea_pks), chunk_size):
+            update_localized_ideas(idea_pks[start:start + chunk_size])
+            if options['verbosity'] > 1:
+                self.stdout.write(
+                    f'{min(start + chunk_size, len(idea_pks))}'
+                    f'/{len(idea_pks)}'
+                )
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt the localized versions of {len(idea_pks)} ideas.'
+        ))
@@ -0,0 +1,138 @@
+import json
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from myproject.apps.core.workers import create_executor
+from myproject.apps.ideas.models import PICTURE_SPECS, IdeaWithTranslatedFields
+from myproject.apps.ideas.pictures import regenerate_picture_renditions
+
+DEFAULT_CHECKPOINT = os.path.join(
+    settings.BASE_DIR, 'tmp', 'regenerate_picture_renditions.json'
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Regenerates the picture renditions of all ideas in parallel, '
+        'skipping the ones registered for the same source file. '
+        'An interrupted run continues from its checkpoint.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--spec',
+            action='append',
+            dest='specs',
+            choices=PICTURE_SPECS,
+            help='Spec to regenerate; can be repeated. Defaults to all.'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count(),
+            help='Number of worker processes.'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=20,
+            help='Number of ideas given to a worker at a time.'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            default=DEFAULT_CHECKPOINT,
+            help='File to keep the progress in.'
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Ignore the checkpoint of a previous run.'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenerate the renditions of unchanged source files too.'
+        )
+
+    def handle(self, *args, **options):
+        specs = options['specs'] or PICTURE_SPECS
+        chunk_size = options['chunk_size']
+        if options['workers'] < 1 or chunk_size < 1:
+            raise CommandError('--workers and --chunk-size must be positive.')
+        checkpoint_path = options['checkpoint']
+
+        qs = IdeaWithTranslatedFields.objects.exclude(
+            picture=''
+        ).exclude(
+            picture=None
+        ).order_by('pk')
+        checkpoint = self.load_checkpoint(checkpoint_path, specs, options)
+        if checkpoint:
+            qs = qs.filter(pk__gt=checkpoint['last_pk'])
+            self.stdout.write(f'Continuing after {checkpoint["last_pk"]}.')
+        idea_pks = list(qs.values_list('pk', flat=True))
+        chunks = [
+            idea_pks[start:start + chunk_size]
+            for start in range(0, len(idea_pks), chunk_size)
+        ]
+
+        picture_count = 0
+        generated_count = 0
+        start_time = time.monotonic()
+        with create_executor(options['workers']) as executor:
+            results = executor.map(
+                regenerate_picture_renditions,
+                chunks,
+                [specs] * len(chunks),
+                [options['force']] * len(chunks)
+            )
+            # map() yields in the order of the chunks, so every idea
+            # up to the checkpoint is done when it is saved
+            for chunk, (pictures, generated) in zip(chunks, results):
+                picture_count += pictures
+                generated_count += generated
+                self.save_checkpoint(checkpoint_path, specs, chunk[-1])
+                if options['verbosity'] > 1:
+                    self.stdout.write(
+                        f'{picture_count}/{len(idea_pks)} pictures, '
+                        f'{self.get_rate(generated_count, start_time)} '
+                        f'images/sec'
+                    )
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated {generated_count} renditions of {picture_count} '
+            f'pictures in {time.monotonic() - start_time:.1f} s '
+            f'({self.get_rate(generated_count, start_time)} images/sec).'
+        ))
+
+    @staticmethod
+    def get_rate(count, start_time):
+        return f'{count / max(time.monotonic() - start_time, 1e-6):.1f}'
+
+    def load_checkpoint(self, checkpoint_path, specs, options):
+        if options['restart'] or not os.path.exists(checkpoint_path):
+            return None
+        with open(checkpoint_path) as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        if checkpoint['specs'] != list(specs):
+            self.stderr.write(
+                'The checkpoint is of other specs; starting over.'
+            )
+            return None
+        return checkpoint
+
+    @staticmethod
+    def save_checkpoint(checkpoint_path, specs, last_pk):
+        os.makedirs(os.path.dirname(checkpoint_path), exist_ok=True)
+        # write and rename, so an interruption never leaves a broken file
+        temporary_path = f'{checkpoint_path}.tmp'
+        with open(temporary_path, 'w') as checkpoint_file:
+            json.dump(
+                {'specs': list(specs), 'last_pk': str(last_pk)},
+                checkpoint_file
+            )
+        os.replace(temporary_path, checkpoint_path)
@@ -0,0 +1,62 @@
+import datetime
+
+from django.core.management.base import BaseCommand
+
+from myproject.apps.ideas.app_settings import MEDIA_PURGE_BATCH_SIZE
+from myproject.apps.ideas.models import MediaDeletion
+from myproject.apps.ideas.pictures import (
+    find_orphaned_media,
+    purge_media_deletions
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Deletes the media files queued for deletion and, with --orphans, '
+        'the idea pictures and renditions nothing refers to. '
+        'Meant to be run periodically, e.g. by cron.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--orphans',
+            action='store_true',
+            help='Also scan the media files for orphans.'
+        )
+        parser.add_argument(
+            '--min-age',
+            type=int,
+            default=24,
+            help='Hours after which an unreferenced file is an orphan.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=MEDIA_PURGE_BATCH_SIZE,
+            help='Number of files deleted at a time.'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only list the orphans.'
+        )
+
+    def handle(self, *args, **options):
+        if options['orphans']:
+            orphans = find_orphaned_media(
+                datetime.timedelta(hours=options['min_age'])
+            )
+            orphan_count = 0
+            for kind, name in orphans:
+                orphan_count += 1
+                if options['dry_run'] or options['verbosity'] > 1:
+                    self.stdout.write(f'{kind}: {name}')
+                if not options['dry_run']:
+                    MediaDeletion.objects.create(kind=kind, name=name)
+            self.stdout.write(f'Found {orphan_count} orphaned files.')
+        if options['dry_run']:
+            return
+        purged_count = purge_media_deletions(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Deleted {purged_count} queued files.'
+        ))
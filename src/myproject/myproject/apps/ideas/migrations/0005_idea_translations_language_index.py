@@ -0,0 +1,17 @@
+# Generated by Django 3.0.14 on 2026-10-18 18:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ideas', '0004_auto_20221118_0744'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ideatranslations',
+            index=models.Index(fields=['language', 'idea'], name='ideas_translations_lang_idx'),
+        ),
+    ]
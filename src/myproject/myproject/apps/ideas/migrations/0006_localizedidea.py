@@ -0,0 +1,44 @@
+# Generated by Django 3.0.14 on 2026-10-18 18:04
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('ideas', '0005_idea_translations_language_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LocalizedIdea',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(max_length=7, verbose_name='Language')),
+                ('title', models.CharField(max_length=200, verbose_name='Title')),
+                ('content_excerpt', models.TextField(blank=True, verbose_name='Content excerpt')),
+                ('category_titles', models.TextField(blank=True, help_text='One category title per line.', verbose_name='Category titles')),
+                ('author_name', models.CharField(blank=True, max_length=255, verbose_name='Author name')),
+                ('rating', models.PositiveSmallIntegerField(blank=True, choices=[(1, '★☆☆☆☆'), (2, '★★☆☆☆'), (3, '★★★☆☆'), (4, '★★★★☆'), (5, '★★★★★')], null=True, verbose_name='Rating')),
+                ('thumbnail_url', models.CharField(blank=True, max_length=255, verbose_name='Thumbnail URL')),
+                ('created', models.DateTimeField(verbose_name='Creation Date and Time')),
+                ('author', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Author')),
+                ('idea', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='localized_versions', to='ideas.IdeaWithTranslatedFields', verbose_name='Idea')),
+            ],
+            options={
+                'verbose_name': 'Localized Idea',
+                'verbose_name_plural': 'Localized Ideas',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='localizedidea',
+            index=models.Index(fields=['language', '-created'], name='ideas_localized_created_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='localizedidea',
+            unique_together={('idea', 'language')},
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.0.14 on 2026-10-18 18:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ideas', '0006_localizedidea'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ideawithtranslatedfields',
+            index=models.Index(fields=['created', 'uuid'], name='ideas_created_uuid_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 3.0.14 on 2026-10-18 18:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ideas', '0007_idea_created_uuid_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PictureRendition',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_name', models.CharField(db_index=True, max_length=255, verbose_name='Source file name')),
+                ('spec', models.CharField(max_length=50, verbose_name='Specification')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='File name')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Creation Date and Time')),
+            ],
+            options={
+                'verbose_name': 'Picture Rendition',
+                'verbose_name_plural': 'Picture Renditions',
+            },
+        ),
+    ]
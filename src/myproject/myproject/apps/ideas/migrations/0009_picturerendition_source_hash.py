@@ -0,0 +1,18 @@
+# Generated by Django 3.0.14 on 2026-10-18 18:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ideas', '0008_picturerendition'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='picturerendition',
+            name='source_hash',
+            field=models.CharField(blank=True, help_text='SHA-1 of the source file the rendition was made of.', max_length=40, verbose_name='Source file hash'),
+        ),
+    ]
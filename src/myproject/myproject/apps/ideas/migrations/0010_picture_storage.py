@@ -0,0 +1,20 @@
+# Generated by Django 3.0.14 on 2026-10-18 18:20
+
+from django.db import migrations, models
+import myproject.apps.ideas.models
+import myproject.apps.ideas.storages
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ideas', '0009_picturerendition_source_hash'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ideawithtranslatedfields',
+            name='picture',
+            field=models.ImageField(blank=True, db_index=True, null=True, storage=myproject.apps.ideas.storages.PictureStorage(), upload_to=myproject.apps.ideas.models.upload_to, verbose_name='Picture'),
+        ),
+    ]
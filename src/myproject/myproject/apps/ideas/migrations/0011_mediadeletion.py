@@ -0,0 +1,26 @@
+# Generated by Django 3.0.14 on 2026-10-18 18:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ideas', '0010_picture_storage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaDeletion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('original', 'Original picture'), ('rendition', 'Picture rendition')], max_length=20, verbose_name='Kind')),
+                ('name', models.CharField(max_length=255, verbose_name='File name')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Creation Date and Time')),
+            ],
+            options={
+                'verbose_name': 'Media Deletion',
+                'verbose_name_plural': 'Media Deletions',
+            },
+        ),
+    ]
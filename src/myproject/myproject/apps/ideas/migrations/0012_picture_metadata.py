@@ -0,0 +1,63 @@
+# Generated by Django 3.0.14 on 2026-10-18 18:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ideas', '0011_mediadeletion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ideawithtranslatedfields',
+            name='picture_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Picture average color'),
+        ),
+        migrations.AddField(
+            model_name='ideawithtranslatedfields',
+            name='picture_format',
+            field=models.CharField(blank=True, editable=False, max_length=10, verbose_name='Picture format'),
+        ),
+        migrations.AddField(
+            model_name='ideawithtranslatedfields',
+            name='picture_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Picture height'),
+        ),
+        migrations.AddField(
+            model_name='ideawithtranslatedfields',
+            name='picture_size',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Picture size in bytes'),
+        ),
+        migrations.AddField(
+            model_name='ideawithtranslatedfields',
+            name='picture_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Picture width'),
+        ),
+        migrations.AddField(
+            model_name='picturerendition',
+            name='color',
+            field=models.CharField(blank=True, max_length=7, verbose_name='Average color'),
+        ),
+        migrations.AddField(
+            model_name='picturerendition',
+            name='format',
+            field=models.CharField(blank=True, max_length=10, verbose_name='Format'),
+        ),
+        migrations.AddField(
+            model_name='picturerendition',
+            name='height',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Height'),
+        ),
+        migrations.AddField(
+            model_name='picturerendition',
+            name='size',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Size in bytes'),
+        ),
+        migrations.AddField(
+            model_name='picturerendition',
+            name='width',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Width'),
+        ),
+    ]
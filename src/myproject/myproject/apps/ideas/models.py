@@ -1,8 +1,8 @@
-import contextlib
 import os
 import uuid
 
 from imagekit.models import ImageSpecField
+from PIL import Image
 from pilkit.processors import ResizeToFill
 
 from django.conf import settings
@@ -20,9 +20,12 @@ from myproject.apps.core.models import (
 )
 from myproject.apps.core.model_field import (
     MultilingualCharField,
+    MultilingualQuerySet,
     MultilingualTextField,
-    TranslatedField
+    TranslatedField,
+    TranslatedQuerySet
 )
+from .storages import picture_storage
 
 RATING_CHOICES = (
     (1, '★☆☆☆☆'),
@@ -94,6 +97,8 @@ class Idea(CreationModificationDateBase,
         default=None
     )
 
+    objects = MultilingualQuerySet.as_manager()
+
     class Meta:
         verbose_name = _('Idea')
         verbose_name_plural = _('Ideas')
@@ -193,8 +198,42 @@ class IdeaWithTranslatedFields(CreationModificationDateBase, UrlBase):
     picture = models.ImageField(
         _('Picture'),
         upload_to=upload_to,
+        storage=picture_storage,
         blank=True,
-        null=True
+        null=True,
+        # to count the ideas sharing a content addressed picture
+        db_index=True
+    )
+    # metadata of the picture, so that it isn't opened for rendering
+    picture_width = models.PositiveIntegerField(
+        _('Picture width'),
+        blank=True,
+        null=True,
+        editable=False
+    )
+    picture_height = models.PositiveIntegerField(
+        _('Picture height'),
+        blank=True,
+        null=True,
+        editable=False
+    )
+    picture_format = models.CharField(
+        _('Picture format'),
+        max_length=10,
+        blank=True,
+        editable=False
+    )
+    picture_size = models.PositiveIntegerField(
+        _('Picture size in bytes'),
+        blank=True,
+        null=True,
+        editable=False
+    )
+    picture_color = models.CharField(
+        _('Picture average color'),
+        max_length=7,
+        blank=True,
+        editable=False
     )
     picture_social = ImageSpecField(
         source='picture',
@@ -213,9 +252,18 @@ class IdeaWithTranslatedFields(CreationModificationDateBase, UrlBase):
         format='PNG'
     )
 
+    objects = TranslatedQuerySet.as_manager()
+
     class Meta:
         verbose_name = _('Idea With Translations')
         verbose_name_plural = _('Ideas With Translations')
+        indexes = [
+            # keyset pagination of IdeaListView
+            models.Index(
+                fields=['created', 'uuid'],
+                name='ideas_created_uuid_idx'
+            )
+        ]
         # unique title for each author,
         # but title can be repeated if author is not set
         constraints = [
@@ -265,21 +313,87 @@ class IdeaWithTranslatedFields(CreationModificationDateBase, UrlBase):
         return reverse('ideas:idea_detail', kwargs={'pk': self.pk})
 
     def delete(self, *args, **kwargs):
-        from django.core.files.storage import default_storage
-        if self.picture:
-            with contextlib.suppress(FileNotFoundError):
-                default_storage.delete(
-                    self.picture_social.path
+        from .pictures import schedule_media_purge
+        if self.picture and not self.get_picture_references().exists():
+            # the files are removed in the background
+            MediaDeletion.objects.bulk_create([
+                MediaDeletion(
+                    kind=MediaDeletion.RENDITION,
+                    name=getattr(self, spec).name
                 )
-                default_storage.delete(
-                    self.picture_large.path
+                for spec in PICTURE_SPECS
+            ] + [
+                MediaDeletion(
+                    kind=MediaDeletion.ORIGINAL,
+                    name=self.picture.name
                 )
-                default_storage.delete(
-                    self.picture_thumbnail.path
-                )
-            self.picture.delete()
+            ])
+            PictureRendition.objects.filter(
+                source_name=self.picture.name
+            ).delete()
+            schedule_media_purge()
         super().delete(*args, **kwargs)
 
+    def get_picture_references(self):
+        """
+        Returns the other ideas having the same picture file,
+        which is possible with content addressed pictures.
+        """
+        return IdeaWithTranslatedFields.objects.filter(
+            picture=self.picture.name
+        ).exclude(pk=self.pk)
+
+    def get_picture_url(self, spec):
+        """
+        Returns the URL of the picture rendition, preferably
+        the one set by pictures.resolve_picture_urls().
+        """
+        resolved_urls = self.__dict__.get('_picture_urls', {})
+        if spec in resolved_urls:
+            return resolved_urls[spec]
+        return getattr(self, spec).url
+
+    def has_picture_rendition(self, spec):
+        """
+        Returns False when pictures.resolve_picture_urls() set the
+        placeholder URL because the rendition isn't generated yet.
+        """
+        renditions = self.__dict__.get('_picture_renditions', {})
+        return renditions.get(spec, True) is not None
+
+    @property
+    def picture_metadata(self):
+        """
+        Returns {spec: PictureRendition} of the renditions registered
+        when pictures.resolve_picture_urls() was called, with their width,
+        height, format, size and color.
+        """
+        return {
+            spec: rendition
+            for spec, rendition in self.__dict__.get(
+                '_picture_renditions', {}
+            ).items()
+            if rendition is not None and rendition.width
+        }
+
+    @property
+    def thumbnail_url(self):
+        if self.picture:
+            return self.get_picture_url('picture_thumbnail')
+        return ''
+
+    @property
+    def large_url(self):
+        if self.picture:
+            return self.get_picture_url('picture_large')
+        return ''
+
+    @property
+    def social_url(self):
+        if self.picture:
+            return self.get_picture_url('picture_social')
+        return ''
+
     @property
     def structured_data(self):
         from django.utils.translation import get_language
@@ -298,10 +412,75 @@ class IdeaWithTranslatedFields(CreationModificationDateBase, UrlBase):
                 self.author.username
             }
             if self.picture:
-                data['image'] = self.picture_social.url
+                data['image'] = self.social_url
+                social_picture = self.picture_metadata.get('picture_social')
+                if social_picture:
+                    data['image'] = {
+                        '@type': 'ImageObject',
+                        'url': self.social_url,
+                        'width': social_picture.width,
+                        'height': social_picture.height
+                    }
             return data
 
 
+# Modern format variants of the picture specs at several widths,
+# e.g. picture_thumbnail_webp_364, for the srcset of <picture> sources.
+# The browser takes the first source type it supports. AVIF is only
+# offered when the installed Pillow can write it (recent Pillow or the
+# pillow-avif-plugin); features.check() warns about unknown features
+# on older versions, so the registered extensions are checked instead.
+PICTURE_VARIANT_FORMATS = [
+    ('WEBP', 'image/webp', {'quality': 80}),
+]
+if '.avif' in Image.registered_extensions():
+    PICTURE_VARIANT_FORMATS.insert(
+        0, ('AVIF', 'image/avif', {'quality': 60})
+    )
+PICTURE_VARIANT_SIZES = {
+    'picture_large': (800, 400),
+    'picture_thumbnail': (728, 250),
+}
+PICTURE_VARIANT_SCALES = (0.5, 1, 1.5)
+
+
+def get_picture_variants(spec):
+    """
+    Returns a list of (mime_type, [(variant_spec, width), ...])
+    for the picture spec.
+    """
+    if spec not in PICTURE_VARIANT_SIZES:
+        return []
+    width, height = PICTURE_VARIANT_SIZES[spec]
+    return [
+        (mime_type, [
+            (f'{spec}_{format.lower()}_{int(width * scale)}',
+             int(width * scale))
+            for scale in PICTURE_VARIANT_SCALES
+        ])
+        for format, mime_type, options in PICTURE_VARIANT_FORMATS
+    ]
+
+
+PICTURE_SPECS = ['picture_social', 'picture_large', 'picture_thumbnail']
+for spec, (width, height) in PICTURE_VARIANT_SIZES.items():
+    for format, mime_type, options in PICTURE_VARIANT_FORMATS:
+        for scale in PICTURE_VARIANT_SCALES:
+            variant_spec = f'{spec}_{format.lower()}_{int(width * scale)}'
+            IdeaWithTranslatedFields.add_to_class(
+                variant_spec,
+                ImageSpecField(
+                    source='picture',
+                    processors=[ResizeToFill(
+                        int(width * scale), int(height * scale)
+                    )],
+                    format=format,
+                    options=options
+                )
+            )
+            PICTURE_SPECS.append(variant_spec)
+
+
 class IdeaTranslations(models.Model):
     idea = models.ForeignKey(
         IdeaWithTranslatedFields,
@@ -326,6 +505,198 @@ class IdeaTranslations(models.Model):
         verbose_name_plural = _('Idea Translations')
         ordering = ['language']
         unique_together = [('idea', 'language')]
+        indexes = [
+            models.Index(
+                fields=['language', 'idea'],
+                name='ideas_translations_lang_idx'
+            )
+        ]
 
     def __str__(self):
         return self.title
+
+
+class LocalizedIdea(models.Model):
+    """
+    Denormalized read model with the resolved data of an idea
+    for one language. It is kept up to date by the signal handlers
+    of the ideas app and rebuilt by the rebuild_localized_ideas
+    management command.
+    """
+    idea = models.ForeignKey(
+        IdeaWithTranslatedFields,
+        verbose_name=_('Idea'),
+        on_delete=models.CASCADE,
+        related_name='localized_versions'
+    )
+    language = models.CharField(
+        _('Language'),
+        max_length=7
+    )
+    title = models.CharField(
+        _('Title'),
+        max_length=200
+    )
+    content_excerpt = models.TextField(
+        _('Content excerpt'),
+        blank=True
+    )
+    category_titles = models.TextField(
+        _('Category titles'),
+        blank=True,
+        help_text=_('One category title per line.')
+    )
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_('Author'),
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name='+'
+    )
+    author_name = models.CharField(
+        _('Author name'),
+        max_length=255,
+        blank=True
+    )
+    rating = models.PositiveSmallIntegerField(
+        _('Rating'),
+        choices=RATING_CHOICES,
+        blank=True,
+        null=True
+    )
+    thumbnail_url = models.CharField(
+        _('Thumbnail URL'),
+        max_length=255,
+        blank=True
+    )
+    created = models.DateTimeField(
+        _('Creation Date and Time')
+    )
+
+    class Meta:
+        verbose_name = _('Localized Idea')
+        verbose_name_plural = _('Localized Ideas')
+        unique_together = [('idea', 'language')]
+        indexes = [
+            models.Index(
+                fields=['language', '-created'],
+                name='ideas_localized_created_idx'
+            )
+        ]
+
+    def __str__(self):
+        return self.title
+
+    def get_url_path(self):
+        return reverse('ideas:idea_detail', kwargs={'pk': self.idea_id})
+
+    @property
+    def translated_title(self):
+        return self.title
+
+    @property
+    def category_title_list(self):
+        return [title for title in self.category_titles.split('\n') if title]
+
+    def get_picture_url(self, spec):
+        # only the thumbnail is kept in the read model
+        if spec == 'picture_thumbnail':
+            return self.thumbnail_url
+        return ''
+
+
+class PictureRendition(models.Model):
+    """
+    Registry of the generated renditions of idea pictures, so that
+    their URLs can be resolved without checking the storage.
+    """
+    source_name = models.CharField(
+        _('Source file name'),
+        max_length=255,
+        db_index=True
+    )
+    spec = models.CharField(
+        _('Specification'),
+        max_length=50
+    )
+    name = models.CharField(
+        _('File name'),
+        max_length=255,
+        unique=True
+    )
+    source_hash = models.CharField(
+        _('Source file hash'),
+        max_length=40,
+        blank=True,
+        help_text=_('SHA-1 of the source file the rendition was made of.')
+    )
+    width = models.PositiveIntegerField(
+        _('Width'),
+        blank=True,
+        null=True
+    )
+    height = models.PositiveIntegerField(
+        _('Height'),
+        blank=True,
+        null=True
+    )
+    format = models.CharField(
+        _('Format'),
+        max_length=10,
+        blank=True
+    )
+    size = models.PositiveIntegerField(
+        _('Size in bytes'),
+        blank=True,
+        null=True
+    )
+    color = models.CharField(
+        _('Average color'),
+        max_length=7,
+        blank=True
+    )
+    created = models.DateTimeField(
+        _('Creation Date and Time'),
+        auto_now_add=True
+    )
+
+    class Meta:
+        verbose_name = _('Picture Rendition')
+        verbose_name_plural = _('Picture Renditions')
+
+    def __str__(self):
+        return self.name
+
+
+class MediaDeletion(models.Model):
+    """
+    Queue of the media files to delete, processed by
+    pictures.purge_media_deletions().
+    """
+    ORIGINAL = 'original'
+    RENDITION = 'rendition'
+    KIND_CHOICES = (
+        (ORIGINAL, _('Original picture')),
+        (RENDITION, _('Picture rendition')),
+    )
+    kind = models.CharField(
+        _('Kind'),
+        max_length=20,
+        choices=KIND_CHOICES
+    )
+    name = models.CharField(
+        _('File name'),
+        max_length=255
+    )
+    created = models.DateTimeField(
+        _('Creation Date and Time'),
+        auto_now_add=True
+    )
+
+    class Meta:
+        verbose_name = _('Media Deletion')
+        verbose_name_plural = _('Media Deletions')
+
+    def __str__(self):
+        return self.name
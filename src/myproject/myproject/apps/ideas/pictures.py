@@ -0,0 +1,430 @@
+import contextlib
+import hashlib
+import logging
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.db import transaction
+from django.templatetags.static import static
+from django.utils.timezone import now as timezone_now
+from imagekit.utils import get_singleton
+from PIL import Image
+
+from myproject.apps.core.workers import create_executor
+from .app_settings import (
+    MEDIA_PURGE_BATCH_SIZE,
+    PICTURE_WORKERS,
+    PREGENERATE_PICTURES
+)
+from .cache import invalidate_ideas
+from .models import (
+    PICTURE_SPECS,
+    IdeaWithTranslatedFields,
+    MediaDeletion,
+    PictureRendition,
+    get_picture_variants
+)
+from .storages import picture_storage
+
+PLACEHOLDER_PATH = 'site/img/picture_placeholder.svg'
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_state = {
+    'executor': None,
+    # keys of the calls submitted to the workers and not done yet
+    'queued': set()
+}
+
+
+def resolve_picture_urls(ideas, specs=PICTURE_SPECS, generate=None):
+    """
+    Sets the URLs and the registered metadata of the picture renditions
+    of the ideas, used by IdeaWithTranslatedFields.get_picture_url() and
+    picture_metadata, with one query to the rendition registry. Only
+    renditions missing from the registry are checked in the storage
+    (and generated if needed). When they are pregenerated in the
+    background, missing renditions get the placeholder URL and are
+    queued instead.
+    Returns the newly registered renditions.
+    """
+    if generate is None:
+        generate = not PREGENERATE_PICTURES
+    cache_files = [
+        (idea, spec, getattr(idea, spec))
+        for idea in ideas if idea.picture
+        for spec in specs
+    ]
+    if not cache_files:
+        return []
+    renditions = {
+        rendition.name: rendition
+        for rendition in PictureRendition.objects.filter(name__in={
+            cache_file.name for idea, spec, cache_file in cache_files
+        })
+    }
+    new_renditions = []
+    for idea, spec, cache_file in cache_files:
+        url = cache_file.storage.url(cache_file.name)
+        rendition = renditions.get(cache_file.name)
+        if rendition is None:
+            if generate:
+                cache_file.generate()
+                rendition = renditions[cache_file.name] = PictureRendition(
+                    source_name=idea.picture.name,
+                    spec=spec,
+                    name=cache_file.name,
+                    source_hash=get_source_hash(idea.picture),
+                    **get_image_metadata(cache_file.storage, cache_file.name)
+                )
+                new_renditions.append(rendition)
+            else:
+                url = static(PLACEHOLDER_PATH)
+                queue_picture_renditions(idea)
+        idea.__dict__.setdefault('_picture_urls', {})[spec] = url
+        idea.__dict__.setdefault('_picture_renditions', {})[spec] = rendition
+    PictureRendition.objects.bulk_create(
+        new_renditions, ignore_conflicts=True
+    )
+    return new_renditions
+
+
+def get_source_hash(picture):
+    """
+    Returns the SHA-1 of the picture file, memoized on the field file.
+    """
+    if not hasattr(picture, '_source_hash'):
+        source_hash = hashlib.sha1()
+        with picture.storage.open(picture.name, 'rb') as source_file:
+            for chunk in source_file.chunks():
+                source_hash.update(chunk)
+        picture._source_hash = source_hash.hexdigest()
+    return picture._source_hash
+
+
+def get_image_metadata(storage, name):
+    """
+    Returns the width, height, format, byte size and average color
+    of the image file, to be stored with it.
+    """
+    with storage.open(name, 'rb') as image_file:
+        image = Image.open(image_file)
+        image_format = image.format
+        width, height = image.size
+        # JPEG images can be decoded at a fraction of their size
+        image.draft('RGB', (64, 64))
+        color = image.convert('RGB').resize((1, 1), Image.BOX).getpixel(
+            (0, 0)
+        )
+    return {
+        'width': width,
+        'height': height,
+        'format': image_format,
+        'size': storage.size(name),
+        'color': '#{:02x}{:02x}{:02x}'.format(*color)
+    }
+
+
+def touch_picture_ideas(picture_names):
+    """
+    Updates the modification date of the ideas showing the pictures
+    and the ideas generation after their renditions or metadata changed,
+    so that conditional GETs don't keep getting the placeholders.
+    """
+    if picture_names:
+        IdeaWithTranslatedFields.objects.filter(
+            picture__in=picture_names
+        ).update(modefied=timezone_now())
+        invalidate_ideas()
+
+
+def store_missing_metadata(ideas):
+    """
+    Stores the metadata of the ideas' original pictures and of their
+    renditions registered before the metadata was kept.
+    """
+    ideas = [idea for idea in ideas if idea.picture]
+    renditions = PictureRendition.objects.filter(
+        source_name__in={idea.picture.name for idea in ideas},
+        width=None
+    )
+    storage = get_media_storage(MediaDeletion.RENDITION)
+    updated_renditions = []
+    for rendition in renditions:
+        with contextlib.suppress(FileNotFoundError):
+            metadata = get_image_metadata(storage, rendition.name)
+            for field_name, value in metadata.items():
+                setattr(rendition, field_name, value)
+            updated_renditions.append(rendition)
+    PictureRendition.objects.bulk_update(
+        updated_renditions, ['width', 'height', 'format', 'size', 'color']
+    )
+    changed_picture_names = {
+        rendition.source_name for rendition in updated_renditions
+    }
+    for idea in ideas:
+        if idea.picture_color:
+            continue
+        with contextlib.suppress(FileNotFoundError):
+            metadata = get_image_metadata(
+                idea.picture.storage, idea.picture.name
+            )
+            # content addressed pictures are shared by several ideas
+            IdeaWithTranslatedFields.objects.filter(
+                picture=idea.picture.name
+            ).update(**{
+                f'picture_{field_name}': value
+                for field_name, value in metadata.items()
+            })
+            changed_picture_names.add(idea.picture.name)
+    touch_picture_ideas(changed_picture_names)
+
+
+def with_variants(*specs):
+    """
+    Returns the picture specs followed by their format variants.
+    """
+    specs_with_variants = []
+    for spec in specs:
+        specs_with_variants.append(spec)
+        for mime_type, variants in get_picture_variants(spec):
+            specs_with_variants += [
+                variant_spec for variant_spec, width in variants
+            ]
+    return specs_with_variants
+
+
+def get_executor():
+    """
+    Returns the pool of worker processes of the current process,
+    started on first use, so that each forked web worker has its own.
+    """
+    with _lock:
+        if _state['executor'] is None:
+            _state['executor'] = create_executor(PICTURE_WORKERS)
+        return _state['executor']
+
+
+def submit_to_workers(key, function, *args):
+    """
+    Calls the function in a worker process after the current
+    transaction is committed, unless a call with the same key
+    is still queued.
+    """
+    with _lock:
+        if key in _state['queued']:
+            return
+        _state['queued'].add(key)
+
+    def done(future):
+        _state['queued'].discard(key)
+        exception = future.exception()
+        if exception is not None:
+            logger.error(
+                'Worker call %r failed', key,
+                exc_info=(type(exception), exception, exception.__traceback__)
+            )
+
+    def submit():
+        try:
+            future = get_executor().submit(function, *args)
+        except BrokenProcessPool:
+            # a worker died, e.g. killed for using too much memory;
+            # start a new pool for the next calls
+            with _lock:
+                _state['executor'] = None
+                _state['queued'].discard(key)
+            return
+        future.add_done_callback(done)
+
+    transaction.on_commit(submit)
+
+
+def queue_picture_renditions(idea):
+    """
+    Generates the picture renditions of the idea in a worker process
+    after the current transaction is committed.
+    """
+    if idea.picture:
+        submit_to_workers(
+            ('renditions', idea.pk, idea.picture.name),
+            generate_picture_renditions,
+            idea.pk
+        )
+
+
+def schedule_media_purge():
+    """
+    Deletes the files queued as MediaDeletion in a worker process
+    after the current transaction is committed.
+    """
+    submit_to_workers(('purge',), purge_media_deletions)
+
+
+def generate_picture_renditions(idea_pk):
+    """
+    Generates and registers the missing picture renditions of the idea
+    and rebuilds its localized versions, which show the thumbnail.
+    Runs in a worker process.
+    """
+    from .read_model import update_localized_ideas
+
+    idea = IdeaWithTranslatedFields.objects.filter(pk=idea_pk).first()
+    if idea is None:
+        return
+    if resolve_picture_urls([idea], generate=True):
+        update_localized_ideas([idea.pk])
+        touch_picture_ideas([idea.picture.name])
+    store_missing_metadata([idea])
+
+
+def regenerate_picture_renditions(idea_pks, specs=PICTURE_SPECS, force=False):
+    """
+    Regenerates the renditions of the ideas' pictures unless they are
+    registered for the same source file content. Runs in a worker
+    process of the regenerate_picture_renditions command.
+    Returns the number of pictures and of generated renditions.
+    """
+    from .read_model import update_localized_ideas
+
+    ideas = [
+        idea for idea in IdeaWithTranslatedFields.objects.filter(
+            pk__in=idea_pks
+        ) if idea.picture
+    ]
+    cache_files = [
+        (idea, spec, getattr(idea, spec))
+        for idea in ideas
+        for spec in specs
+    ]
+    registered_hashes = dict(PictureRendition.objects.filter(
+        name__in={cache_file.name for idea, spec, cache_file in cache_files}
+    ).values_list('name', 'source_hash'))
+    generated_count = 0
+    changed_picture_names = set()
+    changed_thumbnail_pks = set()
+    for idea, spec, cache_file in cache_files:
+        try:
+            source_hash = get_source_hash(idea.picture)
+        except FileNotFoundError:
+            continue
+        registered_hash = registered_hashes.get(cache_file.name)
+        if not force and registered_hash == source_hash:
+            continue
+        cache_file.generate(force=True)
+        PictureRendition.objects.update_or_create(
+            name=cache_file.name,
+            defaults={
+                'source_name': idea.picture.name,
+                'spec': spec,
+                'source_hash': source_hash,
+                **get_image_metadata(cache_file.storage, cache_file.name)
+            }
+        )
+        generated_count += 1
+        changed_picture_names.add(idea.picture.name)
+        if spec == 'picture_thumbnail':
+            changed_thumbnail_pks.add(idea.pk)
+    if changed_thumbnail_pks:
+        update_localized_ideas(changed_thumbnail_pks)
+    touch_picture_ideas(changed_picture_names)
+    return len(ideas), generated_count
+
+
+def get_media_storage(kind):
+    if kind == MediaDeletion.ORIGINAL:
+        return picture_storage
+    return get_singleton(
+        settings.IMAGEKIT_DEFAULT_FILE_STORAGE, 'file storage backend'
+    )
+
+
+def get_referenced_names(kind, names):
+    """
+    Returns the names of the files of the kind which are used again,
+    e.g. by a new idea with the same content addressed picture.
+    """
+    if kind == MediaDeletion.ORIGINAL:
+        return set(IdeaWithTranslatedFields.objects.filter(
+            picture__in=names
+        ).values_list('picture', flat=True))
+    return set(PictureRendition.objects.filter(
+        name__in=names
+    ).values_list('name', flat=True))
+
+
+def purge_media_deletions(batch_size=MEDIA_PURGE_BATCH_SIZE):
+    """
+    Deletes the files queued as MediaDeletion in batches
+    and returns the number of processed entries.
+    """
+    purged_count = 0
+    while True:
+        deletions = list(MediaDeletion.objects.order_by('pk')[:batch_size])
+        if not deletions:
+            return purged_count
+        for kind, kind_label in MediaDeletion.KIND_CHOICES:
+            names = {
+                deletion.name for deletion in deletions
+                if deletion.kind == kind
+            }
+            storage = get_media_storage(kind)
+            for name in names - get_referenced_names(kind, names):
+                with contextlib.suppress(FileNotFoundError):
+                    storage.delete(name)
+        MediaDeletion.objects.filter(
+            pk__in=[deletion.pk for deletion in deletions]
+        ).delete()
+        purged_count += len(deletions)
+
+
+def walk_storage(storage, path):
+    """
+    Yields the names of all files under the path of the storage.
+    """
+    try:
+        directories, files = storage.listdir(path)
+    except FileNotFoundError:
+        return
+    for file_name in files:
+        yield f'{path}/{file_name}'
+    for directory in directories:
+        yield from walk_storage(storage, f'{path}/{directory}')
+
+
+def find_orphaned_media(min_age):
+    """
+    Yields (kind, name) of the original pictures and renditions
+    which no idea or registered rendition refers to and which are
+    older than the min_age timedelta, so uploads in progress are kept.
+    """
+    pictures = set()
+    renditions = set(PictureRendition.objects.values_list('name', flat=True))
+    ideas = IdeaWithTranslatedFields.objects.exclude(
+        picture=''
+    ).exclude(
+        picture=None
+    ).only('pk', 'picture')
+    for idea in ideas.iterator():
+        pictures.add(idea.picture.name)
+        renditions.update(
+            getattr(idea, spec).name for spec in PICTURE_SPECS
+        )
+    queued = set(MediaDeletion.objects.values_list('name', flat=True))
+    modified_before = timezone_now() - min_age
+    for kind, path, referenced in (
+        (MediaDeletion.ORIGINAL, 'ideas', pictures),
+        (
+            MediaDeletion.RENDITION,
+            f'{settings.IMAGEKIT_CACHEFILE_DIR}/ideas',
+            renditions
+        ),
+    ):
+        storage = get_media_storage(kind)
+        for name in walk_storage(storage, path):
+            if name in referenced or name in queued:
+                continue
+            if storage.get_modified_time(name) < modified_before:
+                yield kind, name
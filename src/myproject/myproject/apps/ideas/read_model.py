@@ -0,0 +1,73 @@
+from django.conf import settings
+from django.db import transaction
+from django.utils import translation
+from django.utils.text import Truncator
+
+from .app_settings import CONTENT_EXCERPT_LENGTH
+from .cache import invalidate_ideas
+from .models import IdeaWithTranslatedFields, LocalizedIdea
+from .pictures import resolve_picture_urls
+
+
+def build_localized_ideas(idea):
+    """
+    Returns unsaved LocalizedIdea instances of the idea
+    for all languages.
+    """
+    author_name = ''
+    if idea.author:
+        author_name = idea.author.get_full_name() or idea.author.username
+    thumbnail_url = idea.thumbnail_url
+    localized_ideas = []
+    for lang_code, lang_name in settings.LANGUAGES:
+        with translation.override(lang_code):
+            localized_ideas.append(LocalizedIdea(
+                idea=idea,
+                language=lang_code,
+                title=idea.translated_title,
+                content_excerpt=Truncator(
+                    idea.translated_content
+                ).chars(CONTENT_EXCERPT_LENGTH),
+                category_titles='\n'.join(
+                    category.translated_title
+                    for category in idea.categories.all()
+                ),
+                author=idea.author,
+                author_name=author_name,
+                rating=idea.rating,
+                thumbnail_url=thumbnail_url,
+                created=idea.created
+            ))
+    return localized_ideas
+
+
+def update_localized_ideas(idea_pks):
+    """
+    Rebuilds the LocalizedIdea rows of the given ideas
+    and removes the rows of the ideas which don't exist anymore.
+    """
+    idea_pks = set(idea_pks)
+    ideas = IdeaWithTranslatedFields.objects.filter(
+        pk__in=idea_pks
+    ).select_related('author').prefetch_related(
+        'translations', 'categories'
+    )
+    resolve_picture_urls(ideas, specs=('picture_thumbnail',))
+    localized_ideas = []
+    for idea in ideas:
+        localized_ideas += build_localized_ideas(idea)
+    with transaction.atomic():
+        LocalizedIdea.objects.filter(idea__in=idea_pks).delete()
+        LocalizedIdea.objects.bulk_create(localized_ideas)
+    # pages rendered from the old rows are outdated now
+    invalidate_ideas()
+
+
+def schedule_localized_ideas_update(idea_pks):
+    """
+    Updates the LocalizedIdea rows when the current transaction
+    is committed, so that cascade deletions are finished by then.
+    """
+    idea_pks = list(idea_pks)
+    if idea_pks:
+        transaction.on_commit(lambda: update_localized_ideas(idea_pks))
@@ -0,0 +1,138 @@
+from PIL import Image
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save
+)
+from django.dispatch import receiver
+from django.utils.timezone import now as timezone_now
+
+from myproject.apps.categories.models import Category, CategoryTranslations
+from myproject.apps.core.model_field import TranslatedField
+from .cache import invalidate_ideas
+from .models import IdeaTranslations, IdeaWithTranslatedFields
+from .read_model import schedule_localized_ideas_update
+
+User = get_user_model()
+
+# User fields shown as the author name of ideas
+AUTHOR_NAME_FIELDS = {'first_name', 'last_name', 'username'}
+
+
+@receiver(post_save, sender=IdeaWithTranslatedFields)
+@receiver(post_delete, sender=IdeaWithTranslatedFields)
+@receiver(post_save, sender=IdeaTranslations)
+@receiver(post_delete, sender=IdeaTranslations)
+@receiver(
+    m2m_changed,
+    sender=IdeaWithTranslatedFields.categories.through
+)
+def ideas_changed_handler(sender, **kwargs):
+    if kwargs.get('action', 'post_').startswith('post_'):
+        # A page cached under the new generation before the commit
+        # would show the old ideas until the next change
+        transaction.on_commit(invalidate_ideas)
+
+
+def touch_ideas(idea_pks):
+    '''
+    Updates the modification date of ideas whose translations or
+    categories changed, for the conditional GET of the detail view.
+    '''
+    IdeaWithTranslatedFields.objects.filter(pk__in=idea_pks).update(
+        modefied=timezone_now()
+    )
+
+
+@receiver(post_save, sender=IdeaTranslations)
+@receiver(post_delete, sender=IdeaTranslations)
+def idea_translations_changed_handler(sender, instance, **kwargs):
+    # Only the idea instance attached to the translation can be reached
+    # here, e.g. the one from create_or_update_idea_view().
+    idea = instance._state.fields_cache.get('idea')
+    if idea is not None:
+        TranslatedField.clear_translations(idea)
+    touch_ideas([instance.idea_id])
+    schedule_localized_ideas_update([instance.idea_id])
+
+
+@receiver(pre_save, sender=IdeaWithTranslatedFields)
+def picture_uploaded_handler(sender, instance, **kwargs):
+    picture = instance.picture
+    if not picture:
+        instance.picture_width = instance.picture_height = None
+        instance.picture_format = instance.picture_color = ''
+        instance.picture_size = None
+    elif not picture._committed:
+        # a new upload; its header tells the size without decoding it
+        try:
+            image = Image.open(picture.file)
+            instance.picture_width, instance.picture_height = image.size
+            instance.picture_format = image.format
+        except OSError:
+            instance.picture_width = instance.picture_height = None
+            instance.picture_format = ''
+        picture.file.seek(0)
+        instance.picture_size = picture.size
+        # stored by the rendition worker, which decodes the picture
+        instance.picture_color = ''
+
+
+@receiver(post_save, sender=IdeaWithTranslatedFields)
+def idea_saved_handler(sender, instance, **kwargs):
+    schedule_localized_ideas_update([instance.pk])
+
+
+@receiver(
+    m2m_changed,
+    sender=IdeaWithTranslatedFields.categories.through
+)
+def idea_categories_changed_handler(sender, instance, action, reverse,
+                                    pk_set, **kwargs):
+    if not reverse:
+        # instance is an idea
+        if action.startswith('post_'):
+            touch_ideas([instance.pk])
+            schedule_localized_ideas_update([instance.pk])
+    elif action == 'pre_clear':
+        # instance is a category, whose ideas are unknown after clearing
+        idea_pks = list(instance.category_ideas.values_list('pk', flat=True))
+        touch_ideas(idea_pks)
+        schedule_localized_ideas_update(idea_pks)
+    elif action in ('post_add', 'post_remove'):
+        touch_ideas(pk_set)
+        schedule_localized_ideas_update(pk_set)
+
+
+@receiver(post_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+@receiver(post_save, sender=CategoryTranslations)
+@receiver(post_delete, sender=CategoryTranslations)
+def category_changed_handler(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_ideas)
+    category_id = (
+        instance.pk if sender is Category else instance.category_id
+    )
+    schedule_localized_ideas_update(
+        IdeaWithTranslatedFields.objects.filter(
+            categories=category_id
+        ).values_list('pk', flat=True)
+    )
+
+
+@receiver(post_save, sender=User)
+def author_saved_handler(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) == {'last_login'}:
+        return
+    idea_pks = list(instance.authored_ideas.values_list('pk', flat=True))
+    if not update_fields or AUTHOR_NAME_FIELDS.intersection(update_fields):
+        # the author name is in the structured data of the detail view
+        # and in the author facet labels of the list
+        touch_ideas(idea_pks)
+        transaction.on_commit(invalidate_ideas)
+    schedule_localized_ideas_update(idea_pks)
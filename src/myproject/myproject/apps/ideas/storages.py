@@ -0,0 +1,61 @@
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+from .app_settings import CONTENT_ADDRESSED_PICTURES
+
+CONTENT_ADDRESSED_DIR = 'ideas/sha256'
+
+
+@deconstructible
+class PictureStorage(FileSystemStorage):
+    """
+    Storage of the idea pictures. With IDEAS_CONTENT_ADDRESSED_PICTURES,
+    an upload is hashed while it is written, and stored as
+    ideas/sha256/ab/cd/abcd...<ext>; the same content is stored once.
+    """
+
+    def save(self, name, content, max_length=None):
+        if not CONTENT_ADDRESSED_PICTURES:
+            return super().save(name, content, max_length=max_length)
+        if name is None:
+            name = content.name
+        extension = os.path.splitext(name)[1].lower()
+        directory = self.path(CONTENT_ADDRESSED_DIR)
+        os.makedirs(directory, exist_ok=True)
+        content_hash = hashlib.sha256()
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            suffix='.tmp', dir=directory
+        )
+        try:
+            with os.fdopen(file_descriptor, 'wb') as temporary_file:
+                for chunk in content.chunks():
+                    content_hash.update(chunk)
+                    temporary_file.write(chunk)
+            digest = content_hash.hexdigest()
+            name = '/'.join([
+                CONTENT_ADDRESSED_DIR,
+                digest[:2],
+                digest[2:4],
+                f'{digest}{extension}'
+            ])
+            path = self.path(name)
+            if os.path.exists(path):
+                # the same content was uploaded before
+                os.remove(temporary_path)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(temporary_path, path)
+                if self.file_permissions_mode is not None:
+                    os.chmod(path, self.file_permissions_mode)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        return name
+
+
+picture_storage = PictureStorage()
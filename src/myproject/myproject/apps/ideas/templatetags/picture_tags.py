@@ -0,0 +1,48 @@
+from django import template
+
+from myproject.apps.ideas.models import get_picture_variants
+
+register = template.Library()
+
+
+@register.inclusion_tag('ideas/includes/picture.html')
+def responsive_picture(idea, spec, sizes='100vw', alt=''):
+    '''Renders a <picture> of the idea's picture spec with
+    a srcset of each modern format variant whose renditions
+    are all generated and the spec itself as the fallback
+    image.'''
+    src = ''
+    sources = []
+    metadata = None
+    color = ''
+    if not hasattr(idea, 'picture'):
+        # read model objects keep the URL of the thumbnail only
+        src = idea.get_picture_url(spec)
+    elif idea.picture:
+        src = idea.get_picture_url(spec)
+        metadata = idea.picture_metadata.get(spec)
+        # shown until the picture is loaded or while it's a placeholder
+        color = metadata.color if metadata else idea.picture_color
+        for mime_type, variants in get_picture_variants(spec):
+            # the browser would pick a placeholder over the <img>
+            if not all(
+                idea.has_picture_rendition(variant_spec)
+                for variant_spec, width in variants
+            ):
+                continue
+            sources.append({
+                'type': mime_type,
+                'srcset': ', '.join(
+                    f'{idea.get_picture_url(variant_spec)} {width}w'
+                    for variant_spec, width in variants
+                )
+            })
+    return {
+        'src': src,
+        'sources': sources,
+        'sizes': sizes,
+        'alt': alt,
+        'width': metadata.width if metadata else None,
+        'height': metadata.height if metadata else None,
+        'color': color
+    }
@@ -1,14 +1,45 @@
+import hashlib
+
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import (
     EmptyPage,
-    PageNotAnInteger,
-    Paginator
+    InvalidPage,
+    PageNotAnInteger
 )
 from django.forms import modelformset_factory
 from django.shortcuts import get_object_or_404, redirect, render
+from django.utils.decorators import method_decorator
+from django.utils.translation import get_language
+from django.views.decorators.http import condition
 from django.views.generic import DetailView, ListView, View
 
+from myproject.apps.categories.cache import CATEGORIES_GENERATION
+from myproject.apps.core.cache import (
+    get_generation,
+    get_generation_changed_at
+)
+from myproject.apps.core.decorators import (
+    cache_page_per_generation,
+    get_normalized_query
+)
+from myproject.apps.core.pagination import (
+    CachedCountPaginator,
+    CursorPaginator
+)
+from .app_settings import (
+    COUNT_CACHE_TIMEOUT,
+    COUNT_ESTIMATE_THRESHOLD,
+    CURSOR_PAGINATION,
+    PAGE_CACHE_TIMEOUT,
+    USE_READ_MODEL
+)
+from .cache import (
+    IDEAS_GENERATION,
+    get_ideas_changed_at,
+    get_ideas_generation
+)
+from .facets import filter_ideas, get_facets, normalize_selection
 from .forms import (
     IdeaFilterForm,
     IdeaTranslationsForm,
@@ -18,14 +49,20 @@ from .models import (
     Idea,
     IdeaTranslations,
     IdeaWithTranslatedFields,
+    LocalizedIdea,
     RATING_CHOICES
 )
+from .pictures import (
+    queue_picture_renditions,
+    resolve_picture_urls,
+    with_variants
+)
 
 PAGE_SIZE = getattr(settings, 'PAGE_SIZE', 24)
 
 
 def idea_detail_view(request, idea_id=None):
-    idea = get_object_or_404(Idea, id=idea_id)
+    idea = get_object_or_404(Idea.objects.for_language(), id=idea_id)
     is_translated = False
     template_name = 'ideas/idea_detail.html'
     lang_code_list = [
@@ -59,12 +96,79 @@ class IdeaWithTranslatedFieldsListView(ListView):
     model = IdeaWithTranslatedFields
     template_name = 'ideas/idea_list.html'
 
-
+    def get_queryset(self):
+        return super().get_queryset().with_translations()
+
+
+def get_idea_modified(request, pk):
+    # memoized on the request for both the ETag and Last-Modified
+    if not hasattr(request, '_idea_modified'):
+        request._idea_modified = IdeaWithTranslatedFields.objects.filter(
+            pk=pk
+        ).values_list('modefied', flat=True).first()
+    return request._idea_modified
+
+
+def idea_detail_etag(request, pk):
+    modified = get_idea_modified(request, pk)
+    if modified is None:
+        return None
+    return hashlib.md5('{}:{}:{}:{}:{}'.format(
+        pk,
+        modified.isoformat(),
+        get_generation(CATEGORIES_GENERATION),
+        get_language(),
+        request.user.pk
+    ).encode()).hexdigest()
+
+
+def idea_detail_last_modified(request, pk):
+    # the page of a logged-in user changes with the login
+    if request.user.is_authenticated:
+        return None
+    modified = get_idea_modified(request, pk)
+    categories_changed_at = get_generation_changed_at(CATEGORIES_GENERATION)
+    if modified and categories_changed_at:
+        modified = max(modified, categories_changed_at)
+    return modified
+
+
+def idea_list_etag(request, *args, **kwargs):
+    return hashlib.md5('{}:{}:{}:{}:{}'.format(
+        get_ideas_generation(),
+        get_language(),
+        request.path,
+        get_normalized_query(request),
+        request.user.pk
+    ).encode()).hexdigest()
+
+
+def idea_list_last_modified(request, *args, **kwargs):
+    if request.user.is_authenticated:
+        return None
+    return get_ideas_changed_at()
+
+
+@method_decorator(
+    condition(
+        etag_func=idea_detail_etag,
+        last_modified_func=idea_detail_last_modified
+    ),
+    name='dispatch'
+)
 class IdeaWithTranslatedFieldsDetailView(DetailView):
     model = IdeaWithTranslatedFields
     context_object_name = 'idea'
     template_name = 'ideas/idea_detail.html'
 
+    def get_queryset(self):
+        return super().get_queryset().with_translations()
+
+    def get_object(self, queryset=None):
+        idea = super().get_object(queryset)
+        resolve_picture_urls([idea])
+        return idea
+
     def get_context_data(self, **kwargs):
         context = super(
             IdeaWithTranslatedFieldsDetailView,
@@ -101,6 +205,8 @@ def create_or_update_idea_view(request, pk=None):
         )
         if form.is_valid() and translations_formset.is_valid():
             idea = form.save()
+            if 'picture' in form.changed_data:
+                queue_picture_renditions(idea)
             translations = translations_formset.save(
                 commit=False
             )
@@ -146,28 +252,37 @@ def delete_idea_view(request, pk):
     )
 
 
+def get_paginator(qs):
+    return CachedCountPaginator(
+        qs,
+        PAGE_SIZE,
+        generation=IDEAS_GENERATION,
+        cache_timeout=COUNT_CACHE_TIMEOUT,
+        estimate_threshold=COUNT_ESTIMATE_THRESHOLD
+    )
+
+
+@condition(
+    etag_func=idea_list_etag,
+    last_modified_func=idea_list_last_modified
+)
+@cache_page_per_generation(IDEAS_GENERATION, PAGE_CACHE_TIMEOUT)
 def idea_with_translated_fields_list_view(request):
-    qs = IdeaWithTranslatedFields.objects.order_by('title')
+    qs = IdeaWithTranslatedFields.objects.annotate_translated(
+        'title'
+    ).order_by('translated_title')
     form = IdeaFilterForm(data=request.GET)
 
     facets = {
         'selected': {},
-        'categories': {
-            'authors': form.fields['author'].queryset,
-            'categories': form.fields['category'].queryset,
-            'ratings': RATING_CHOICES
-        }
+        'categories': {}
     }
-
+    selection = {}
     if form.is_valid():
-        filters = (
-            ('author', 'author'),
-            ('category', 'categories'),
-            ('rating', 'rating')
-        )
-        qs = filter_facets(facets, qs, form, filters)
+        qs, selection = filter_facets(facets, qs, form)
+    facets['categories'] = get_facets(selection)
 
-    paginator = Paginator(qs, PAGE_SIZE)
+    paginator = get_paginator(qs)
     page_number = request.GET.get('page')
     try:
         page = paginator.page(page_number)
@@ -177,6 +292,9 @@ def idea_with_translated_fields_list_view(request):
     except EmptyPage:
         # If page is out of range, show last existing page
         page = paginator.page(paginator.num_pages)
+    resolve_picture_urls(
+        page.object_list, specs=with_variants('picture_thumbnail')
+    )
 
     context = {
         'form': form,
@@ -186,28 +304,50 @@ def idea_with_translated_fields_list_view(request):
     return render(request, 'ideas/idea_list.html', context)
 
 
-def filter_facets(facets, qs, form, filters):
-    for query_param, filter_param in filters:
-        value = form.cleaned_data[query_param]
-        if value:
-            selected_value = value
-            if query_param == 'rating':
-                rating = int(value)
-                selected_value = (rating, dict(RATING_CHOICES)[rating])
-            facets['selected'][query_param] = selected_value
-            filter_args = {filter_param: value}
-            qs = qs.filter(**filter_args).distinct()
-    return qs
-
-
+def filter_facets(facets, qs, form, idea_field='pk'):
+    '''
+    Filters the queryset by the selected facet values and returns it
+    with the normalized selection. Categories are matched with EXISTS
+    subqueries, so the results need no DISTINCT.
+    '''
+    selection = normalize_selection(form.cleaned_data)
+    for query_param, value in selection.items():
+        selected_value = value
+        if query_param == 'author':
+            selected_value = form.cleaned_data['author']
+        elif query_param == 'rating':
+            selected_value = (value, dict(RATING_CHOICES)[value])
+        facets['selected'][query_param] = selected_value
+    qs = filter_ideas(qs, selection, idea_field)
+    return qs, selection
+
+
+@method_decorator(
+    condition(
+        etag_func=idea_list_etag,
+        last_modified_func=idea_list_last_modified
+    ),
+    name='dispatch'
+)
+@method_decorator(
+    cache_page_per_generation(IDEAS_GENERATION, PAGE_CACHE_TIMEOUT),
+    name='dispatch'
+)
 class IdeaListView(View):
     form_class = IdeaFilterForm
     template_name = 'ideas/idea_list.html'
+    use_read_model = USE_READ_MODEL
+    cursor_pagination = CURSOR_PAGINATION
 
     def get(self, request, *args, **kwargs):
         form = self.form_class(data=request.GET)
         qs, facets = self.get_queryset_and_facets(form)
         page = self.get_page(request, qs)
+        if not self.use_read_model:
+            resolve_picture_urls(
+                page.object_list,
+                specs=with_variants('picture_thumbnail')
+            )
         context = {
             'form': form,
             'facets': facets,
@@ -216,46 +356,30 @@ class IdeaListView(View):
         return render(request, self.template_name, context)
 
     def get_queryset_and_facets(self, form):
-        qs = IdeaWithTranslatedFields.objects.order_by(
-            '-created'
-        )
+        if self.use_read_model:
+            qs = LocalizedIdea.objects.filter(
+                language=get_language()
+            ).order_by('-created')
+            idea_field = 'idea'
+        else:
+            qs = IdeaWithTranslatedFields.objects.with_translations(
+            ).order_by('-created')
+            idea_field = 'pk'
         facets = {
             'selected': {},
-            'categories': {
-                'authors': form.fields['author'].queryset,
-                'categories': form.fields['category'].queryset,
-                'ratings': RATING_CHOICES
-            }
+            'categories': {}
         }
+        selection = {}
         if form.is_valid():
-            filters = (
-                # query parameter, filter parameter
-                ('author', 'author'),
-                ('category', 'categories'),
-                ('rating', 'rating')
-            )
-            qs = self.filter_facets(facets, qs, form, filters)
+            qs, selection = filter_facets(facets, qs, form, idea_field)
+        # counts of each facet value under the other selected values
+        facets['categories'] = get_facets(selection)
         return qs, facets
 
-    @staticmethod
-    def filter_facets(facets, qs, form, filters):
-        for query_param, filter_param in filters:
-            value = form.cleaned_data[query_param]
-            if value:
-                selected_value = value
-                if query_param == 'rating':
-                    rating = int(value)
-                    selected_value = (
-                        rating,
-                        dict(RATING_CHOICES)[rating]
-                    )
-                facets['selected'][query_param] = selected_value
-                filter_args = {filter_param: value}
-                qs = qs.filter(**filter_args).distinct()
-        return qs
-
     def get_page(self, request, qs):
-        paginator = Paginator(qs, PAGE_SIZE)
+        if self.cursor_pagination or 'after' in request.GET:
+            return self.get_cursor_page(request, qs)
+        paginator = get_paginator(qs)
         page_number = request.GET.get('page')
         try:
             page = paginator.page(page_number)
@@ -264,3 +388,13 @@ class IdeaListView(View):
         except EmptyPage:
             page = paginator.page(paginator.num_pages)
         return page
+
+    def get_cursor_page(self, request, qs):
+        paginator = CursorPaginator(
+            qs, PAGE_SIZE, ordering=('-created', '-pk')
+        )
+        try:
+            page = paginator.page(request.GET.get('after'))
+        except InvalidPage:
+            page = paginator.page()
+        return page
@@ -0,0 +1,25 @@
+from django.conf import settings
+
+# Seconds between a change of an indexed object and the update
+# of the search indexes, so that the changes are indexed in batches
+INDEX_QUEUE_INTERVAL = getattr(settings, 'SEARCH_INDEX_QUEUE_INTERVAL', 5)
+# Number of queued objects indexed at a time
+INDEX_QUEUE_BATCH_SIZE = getattr(
+    settings, 'SEARCH_INDEX_QUEUE_BATCH_SIZE', 500
+)
+# Seconds to wait for the write lock of a Whoosh index when indexing
+WRITER_LOCK_TIMEOUT = getattr(settings, 'SEARCH_WRITER_LOCK_TIMEOUT', 60)
+# Number of objects prepared and indexed at a time in each language,
+# which bounds the memory used for indexing
+INDEX_CHUNK_SIZE = getattr(settings, 'SEARCH_INDEX_CHUNK_SIZE', 1000)
+# PostgreSQL text search configuration of each language used by
+# the PostgreSQL search engine; other languages use "simple"
+TEXT_SEARCH_CONFIGS = getattr(settings, 'SEARCH_TEXT_SEARCH_CONFIGS', {
+    'en': 'english',
+    'ru': 'russian',
+    'fr': 'french',
+    'de': 'german'
+})
+# Number of search result pages whose results are kept in each
+# process, least recently used first out; 0 to not cache them
+RESULT_CACHE_SIZE = getattr(settings, 'SEARCH_RESULT_CACHE_SIZE', 1000)
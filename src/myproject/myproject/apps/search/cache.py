@@ -0,0 +1,46 @@
+import threading
+from collections import OrderedDict
+
+from myproject.apps.core.cache import bump_generation, get_generation
+from .app_settings import RESULT_CACHE_SIZE
+
+_lock = threading.Lock()
+_state = {
+    # {key: (results, hits, spelling_suggestion)}, least recently used first
+    'results': OrderedDict()
+}
+
+
+def index_generation_name(lang_code):
+    return f'search_index:{lang_code}'
+
+
+def get_index_generation(lang_code):
+    return get_generation(index_generation_name(lang_code))
+
+
+def invalidate_search_results(lang_code):
+    """
+    Moves the search index of the language to the next generation
+    after it was changed, so that the results cached by all
+    processes for the previous one are not used anymore.
+    """
+    bump_generation(index_generation_name(lang_code))
+
+
+def get_cached_results(key):
+    with _lock:
+        cached = _state['results'].get(key)
+        if cached is not None:
+            _state['results'].move_to_end(key)
+        return cached
+
+
+def set_cached_results(key, cached):
+    if RESULT_CACHE_SIZE <= 0:
+        return
+    with _lock:
+        _state['results'][key] = cached
+        _state['results'].move_to_end(key)
+        while len(_state['results']) > RESULT_CACHE_SIZE:
+            _state['results'].popitem(last=False)
@@ -0,0 +1,106 @@
+import threading
+from collections import defaultdict
+
+from django.apps import apps
+from django.db import close_old_connections, connections as db_connections
+from django.db import transaction
+from haystack import connections
+
+from .app_settings import INDEX_QUEUE_BATCH_SIZE, INDEX_QUEUE_INTERVAL
+from .models import IndexQueueItem
+
+_lock = threading.Lock()
+_state = {
+    'timer': None
+}
+
+
+def queue_for_indexing(model, pks):
+    """
+    Marks the objects as changed in the current transaction
+    and schedules the next flush of the queue after the commit.
+    Backends storing the index in the database update it in the
+    current transaction instead.
+    """
+    pks = {str(pk) for pk in pks}
+    if not pks:
+        return
+    backend = connections['default'].get_backend()
+    if getattr(backend, 'updates_in_transaction', False):
+        update_search_index(model, pks)
+        return
+    IndexQueueItem.objects.bulk_create([
+        IndexQueueItem(model_label=model._meta.label, object_pk=pk)
+        for pk in pks
+    ], ignore_conflicts=True)
+    transaction.on_commit(schedule_flush)
+
+
+def schedule_flush():
+    """
+    Flushes the queue in a thread of this process after
+    INDEX_QUEUE_INTERVAL seconds, unless a flush is already pending.
+    """
+    with _lock:
+        if _state['timer'] is not None:
+            return
+        timer = threading.Timer(INDEX_QUEUE_INTERVAL, flush_in_thread)
+        timer.daemon = True
+        _state['timer'] = timer
+    timer.start()
+
+
+def flush_in_thread():
+    with _lock:
+        _state['timer'] = None
+    try:
+        flush_index_queue()
+    finally:
+        # the connections of this thread aren't closed by a request
+        db_connections.close_all()
+
+
+def flush_index_queue(batch_size=INDEX_QUEUE_BATCH_SIZE):
+    """
+    Updates the queued objects in the search indexes of all languages,
+    or removes the ones which don't exist anymore, in batches.
+    Returns the number of processed objects.
+    """
+    close_old_connections()
+    flushed_count = 0
+    while True:
+        with transaction.atomic():
+            # Rows claimed by the flush of another process are skipped
+            items = list(
+                IndexQueueItem.objects.select_for_update(
+                    skip_locked=True
+                ).order_by('pk')[:batch_size]
+            )
+            if not items:
+                return flushed_count
+            # The deletion is committed only after the indexes are
+            # updated. Until then, changes of the claimed objects wait
+            # to be queued again instead of being ignored as conflicts.
+            IndexQueueItem.objects.filter(
+                pk__in=[item.pk for item in items]
+            ).delete()
+            pks_by_model = defaultdict(set)
+            for item in items:
+                pks_by_model[item.model_label].add(item.object_pk)
+            for model_label, pks in pks_by_model.items():
+                update_search_index(apps.get_model(model_label), pks)
+        flushed_count += len(items)
+
+
+def update_search_index(model, pks):
+    """
+    Updates the objects in the search indexes of all languages,
+    or removes the ones which don't exist anymore.
+    """
+    backend = connections['default'].get_backend()
+    index = connections['default'].get_unified_index().get_index(model)
+    objects = list(index.index_queryset().filter(pk__in=pks))
+    if objects:
+        backend.update(index, objects)
+    for pk in set(pks) - {str(obj.pk) for obj in objects}:
+        backend.remove(f'{model._meta.label_lower}.{pk}')
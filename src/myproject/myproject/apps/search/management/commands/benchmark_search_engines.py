@@ -0,0 +1,139 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import translation
+from haystack import connections
+
+from myproject.apps.ideas.models import IdeaWithTranslatedFields
+from myproject.apps.search.models import SearchDocument
+from myproject.apps.search.multilingual_whoosh_backend import (
+    MultilingualWhooshSearchBackend,
+    get_language_alias
+)
+from myproject.apps.search.postgres_backend import PostgresSearchBackend
+
+
+def get_percentile(values, percent):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares the indexing throughput and the query latency of the '
+        'Whoosh indexes and of the PostgreSQL full-text search on the '
+        'ideas. Both indexes are updated with the current ideas.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--queries',
+            type=int,
+            default=20,
+            help='Number of words from idea titles searched per language.'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Number of times each query is run.'
+        )
+        parser.add_argument(
+            '--page-size',
+            type=int,
+            default=20,
+            help='Number of results fetched per query.'
+        )
+
+    def handle(self, *args, **options):
+        index = connections['default'].get_unified_index().get_index(
+            IdeaWithTranslatedFields
+        )
+        idea_count = index.index_queryset().count()
+        if not idea_count:
+            self.stderr.write('There are no ideas to index.')
+            return
+        # the Whoosh indexes of the languages are written through
+        # the multilingual backend of the default connection
+        whoosh_backend = MultilingualWhooshSearchBackend(
+            'default',
+            **settings.HAYSTACK_CONNECTIONS[
+                get_language_alias(settings.LANGUAGE_CODE)
+            ]
+        )
+        postgres_backend = PostgresSearchBackend('default')
+        queries = self.get_queries(index, options['queries'])
+        self.stdout.write(
+            f'{idea_count} ideas, {len(settings.LANGUAGES)} languages'
+        )
+        for engine_name, backend, search in (
+            ('Whoosh', whoosh_backend, self.search_whoosh),
+            ('PostgreSQL', postgres_backend, self.search_postgres),
+        ):
+            start = time.perf_counter()
+            backend.update(index, index.index_queryset())
+            duration = time.perf_counter() - start
+            self.stdout.write(
+                f'{engine_name:<12} indexing {idea_count / duration:9.1f} '
+                f'ideas/s'
+            )
+            if backend is postgres_backend:
+                # As autovacuum would do after the bulk update; with the
+                # statistics of the old vectors the planner misjudges
+                # the matches of the first language searched
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f'ANALYZE {SearchDocument._meta.db_table}'
+                    )
+            for lang_code, lang_name in settings.LANGUAGES:
+                timings = []
+                with translation.override(lang_code):
+                    for query in queries[lang_code] * options['repeat']:
+                        start = time.perf_counter()
+                        search(
+                            backend, index, query, options['page_size']
+                        )
+                        timings.append(time.perf_counter() - start)
+                if timings:
+                    self.write_row(engine_name, lang_code, timings)
+
+    @staticmethod
+    def get_queries(index, count):
+        """
+        Returns {lang_code: words} with the longest word of the
+        translated titles of random ideas.
+        """
+        ideas = list(index.index_queryset().order_by('?')[:count])
+        queries = {}
+        for lang_code, lang_name in settings.LANGUAGES:
+            with translation.override(lang_code):
+                queries[lang_code] = [
+                    max(idea.translated_title.split(), key=len)
+                    for idea in ideas if idea.translated_title.strip()
+                ]
+        return queries
+
+    @staticmethod
+    def search_whoosh(backend, index, query, page_size):
+        language_backend = connections[
+            get_language_alias(translation.get_language())
+        ].get_backend()
+        return language_backend.search(
+            query, end_offset=page_size, models=[index.get_model()]
+        )
+
+    @staticmethod
+    def search_postgres(backend, index, query, page_size):
+        return backend.search(
+            query, end_offset=page_size, models=[index.get_model()]
+        )
+
+    def write_row(self, engine_name, lang_code, timings):
+        self.stdout.write(
+            f'{engine_name:<12} {lang_code:<8} '
+            f'p50 {statistics.median(timings) * 1000:8.1f} ms   '
+            f'p95 {get_percentile(timings, 95) * 1000:8.1f} ms'
+        )
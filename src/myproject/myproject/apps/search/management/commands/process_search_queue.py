@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from myproject.apps.search.app_settings import (
+    INDEX_QUEUE_BATCH_SIZE,
+    INDEX_QUEUE_INTERVAL
+)
+from myproject.apps.search.index_queue import flush_index_queue
+
+
+class Command(BaseCommand):
+    help = (
+        'Updates the search indexes with the queued changes; with --loop, '
+        'keeps doing it every few seconds.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep flushing the queue until interrupted.'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=INDEX_QUEUE_INTERVAL,
+            help='Seconds between the flushes with --loop.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=INDEX_QUEUE_BATCH_SIZE,
+            help='Number of objects indexed at a time.'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            flushed_count = flush_index_queue(options['batch_size'])
+            if flushed_count or options['verbosity'] > 1:
+                self.stdout.write(f'Indexed {flushed_count} queued objects.')
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
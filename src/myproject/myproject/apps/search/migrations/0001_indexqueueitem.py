@@ -0,0 +1,28 @@
+# Generated by Django 3.0.14 on 2026-10-18 18:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndexQueueItem',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_label', models.CharField(max_length=100, verbose_name='Model')),
+                ('object_pk', models.CharField(max_length=36, verbose_name='Object ID')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Creation Date and Time')),
+            ],
+            options={
+                'verbose_name': 'Search Index Queue Item',
+                'verbose_name_plural': 'Search Index Queue Items',
+                'unique_together': {('model_label', 'object_pk')},
+            },
+        ),
+    ]
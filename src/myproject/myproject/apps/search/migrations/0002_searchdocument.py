@@ -0,0 +1,56 @@
+# Generated by Django 3.0.14 on 2026-10-18 18:38
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_indexqueueitem'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_label', models.CharField(max_length=100, verbose_name='Model')),
+                ('object_pk', models.CharField(max_length=36, verbose_name='Object ID')),
+                ('modified', models.DateTimeField(auto_now=True, verbose_name='Modification Date and Time')),
+                ('text_en', models.TextField(blank=True, verbose_name='Text (en)')),
+                ('vector_en', django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Search Vector (en)')),
+                ('text_ru', models.TextField(blank=True, verbose_name='Text (ru)')),
+                ('vector_ru', django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Search Vector (ru)')),
+                ('text_fr', models.TextField(blank=True, verbose_name='Text (fr)')),
+                ('vector_fr', django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Search Vector (fr)')),
+                ('text_de', models.TextField(blank=True, verbose_name='Text (de)')),
+                ('vector_de', django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Search Vector (de)')),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'verbose_name_plural': 'Search Documents',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='searchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['vector_en'], name='search_vector_en_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='searchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['vector_ru'], name='search_vector_ru_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='searchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['vector_fr'], name='search_vector_fr_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='searchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['vector_de'], name='search_vector_de_gin'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='searchdocument',
+            unique_together={('model_label', 'object_pk')},
+        ),
+    ]
@@ -1,3 +1,94 @@
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.utils.translation import gettext_lazy as _
 
-# Create your models here.
+
+class IndexQueueItem(models.Model):
+    """
+    Object waiting to be updated in or removed from the search indexes
+    by index_queue.flush_index_queue().
+    """
+    model_label = models.CharField(
+        _('Model'),
+        max_length=100
+    )
+    object_pk = models.CharField(
+        _('Object ID'),
+        max_length=36
+    )
+    created = models.DateTimeField(
+        _('Creation Date and Time'),
+        auto_now_add=True
+    )
+
+    class Meta:
+        verbose_name = _('Search Index Queue Item')
+        verbose_name_plural = _('Search Index Queue Items')
+        unique_together = [('model_label', 'object_pk')]
+
+    def __str__(self):
+        return f'{self.model_label}.{self.object_pk}'
+
+
+class SearchDocument(models.Model):
+    """
+    Text of an indexed object in each language with its tsvector,
+    searched by the PostgreSQL search engine of postgres_backend.
+    """
+    model_label = models.CharField(
+        _('Model'),
+        max_length=100
+    )
+    object_pk = models.CharField(
+        _('Object ID'),
+        max_length=36
+    )
+    modified = models.DateTimeField(
+        _('Modification Date and Time'),
+        auto_now=True
+    )
+
+    class Meta:
+        verbose_name = _('Search Document')
+        verbose_name_plural = _('Search Documents')
+        unique_together = [('model_label', 'object_pk')]
+        indexes = [
+            GinIndex(
+                fields=[f'vector_{lang_code.replace("-", "_")}'],
+                name=f'search_vector_{lang_code.replace("-", "_")}_gin'
+            )
+            for lang_code, lang_name in settings.LANGUAGES
+        ]
+
+    def __str__(self):
+        return f'{self.model_label}.{self.object_pk}'
+
+    @staticmethod
+    def text_field_name(lang_code):
+        lang_code_underscored = lang_code.replace('-', '_')
+        return f'text_{lang_code_underscored}'
+
+    @staticmethod
+    def vector_field_name(lang_code):
+        lang_code_underscored = lang_code.replace('-', '_')
+        return f'vector_{lang_code_underscored}'
+
+
+for lang_code, lang_name in settings.LANGUAGES:
+    SearchDocument.add_to_class(
+        SearchDocument.text_field_name(lang_code),
+        models.TextField(
+            _('Text ({})').format(lang_code),
+            blank=True
+        )
+    )
+    SearchDocument.add_to_class(
+        SearchDocument.vector_field_name(lang_code),
+        SearchVectorField(
+            _('Search Vector ({})').format(lang_code),
+            null=True,
+            editable=False
+        )
+    )
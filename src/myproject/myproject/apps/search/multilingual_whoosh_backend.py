@@ -1,4 +1,7 @@
+import itertools
+
 from django.conf import settings
+from django.db.models import QuerySet
 from django.utils import translation
 from haystack.backends.whoosh_backend import (
     WhooshEngine,
@@ -7,6 +10,51 @@ from haystack.backends.whoosh_backend import (
 )
 from haystack import connections
 from haystack.constants import DEFAULT_ALIAS
+from haystack.exceptions import SkipDocument
+from haystack.models import SearchResult
+from haystack.utils import get_identifier
+
+from .app_settings import INDEX_CHUNK_SIZE, WRITER_LOCK_TIMEOUT
+from .cache import (
+    get_cached_results,
+    get_index_generation,
+    invalidate_search_results,
+    set_cached_results
+)
+
+
+def get_language_alias(lang_code):
+    lang_code_underscored = lang_code.replace('-', '_')
+    return f'default_{lang_code_underscored}'
+
+
+def get_alias_language(alias):
+    """
+    Returns the language of the search index of the connection;
+    the default connection uses the index of the default language.
+    """
+    for lang_code, lang_name in settings.LANGUAGES:
+        if alias == get_language_alias(lang_code):
+            return lang_code
+    return settings.LANGUAGE_CODE
+
+
+def get_chunks(index, iterable, chunk_size=INDEX_CHUNK_SIZE):
+    """
+    Yields lists of up to chunk_size objects of the iterable with the
+    related objects used by the index prefetched, so that only one chunk
+    is kept in memory. Querysets are streamed from the database.
+    """
+    if isinstance(iterable, QuerySet):
+        iterable = iterable.iterator(chunk_size=chunk_size)
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        if hasattr(index, 'prefetch_batch'):
+            index.prefetch_batch(chunk)
+        yield chunk
 
 
 class MultilingualWhooshSearchBackend(WhooshSearchBackend):
@@ -16,26 +64,153 @@ class MultilingualWhooshSearchBackend(WhooshSearchBackend):
             current_language = (
                 translation.get_language() or settings.LANGUAGE_CODE
             )[:2]
+            # each chunk is loaded once and indexed in all languages
+            for chunk in get_chunks(index, iterable):
+                for lang_code, lang_name in settings.LANGUAGES:
+                    using = get_language_alias(lang_code)
+                    translation.activate(lang_code)
+                    backend = connections[using].get_backend()
+                    backend.update(
+                        index, chunk, commit,
+                        language_specific=True
+                    )
+            translation.activate(current_language)
+        elif language_specific:
+            self.update_documents(index, iterable)
+            invalidate_search_results(
+                get_alias_language(self.connection_alias)
+            )
+
+    def update_documents(self, index, iterable):
+        """
+        Indexes the objects like WhooshSearchBackend.update(), but with
+        a writer that waits for the lock of the index and has committed
+        when this returns; the AsyncWriter used by the former may commit
+        later in a thread, after the cached results were invalidated.
+        """
+        if not self.setup_complete:
+            self.setup()
+
+        self.index = self.index.refresh()
+        documents = []
+        for obj in iterable:
+            try:
+                doc = index.full_prepare(obj)
+            except SkipDocument:
+                self.log.debug('Indexing for object `%s` skipped', obj)
+                continue
+            # Document boosts aren't supported in Whoosh 2.5.0+
+            doc.pop('boost', None)
+            documents.append((obj, {
+                key: self._from_python(value) for key, value in doc.items()
+            }))
+        if not documents:
+            return
+
+        writer = self.index.writer(timeout=WRITER_LOCK_TIMEOUT)
+        try:
+            for obj, doc in documents:
+                try:
+                    writer.update_document(**doc)
+                except Exception as e:
+                    if not self.silently_fail:
+                        raise
+                    self.log.error(
+                        '%s while preparing object for update',
+                        e.__class__.__name__,
+                        exc_info=True,
+                        extra={'data': {
+                            'index': index,
+                            'object': get_identifier(obj)
+                        }}
+                    )
+        except Exception:
+            writer.cancel()
+            raise
+        writer.commit()
+
+    def remove(self, obj_or_string, commit=True, language_specific=False):
+        if not language_specific and self.connection_alias == 'default':
             for lang_code, lang_name in settings.LANGUAGES:
-                lang_code_underscored = lang_code.replace('-', '_')
-                using = f'default_{lang_code_underscored}'
-                translation.activate(lang_code)
-                backend = connections[using].get_backend()
-                backend.update(
-                    index, iterable, commit,
+                backend = connections[
+                    get_language_alias(lang_code)
+                ].get_backend()
+                backend.remove(
+                    obj_or_string, commit,
                     language_specific=True
                 )
-            translation.activate(current_language)
         elif language_specific:
-            super().update(index, iterable, commit)
+            super().remove(obj_or_string, commit)
+            invalidate_search_results(
+                get_alias_language(self.connection_alias)
+            )
 
+    def clear(self, models=None, commit=True):
+        super().clear(models, commit)
+        invalidate_search_results(get_alias_language(self.connection_alias))
 
 class MultilingualWhooshSearchQuery(WhooshSearchQuery):
+    # results with these options are not cached
+    UNCACHED_OPTIONS = ('highlight', 'facets', 'date_facets', 'query_facets')
+
     def __init__(self, using=DEFAULT_ALIAS):
-        lang_code_underscored = translation.get_language().replace('-', '_')
-        using = f'default_{lang_code_underscored}'
+        using = get_language_alias(translation.get_language())
         super().__init__(using=using)
 
+    def run(self, spelling_query=None, **kwargs):
+        """
+        Runs the query, or takes its results from the cache of the
+        current index generation of the language.
+        """
+        search_kwargs = self.build_params(spelling_query=spelling_query)
+        search_kwargs.update(kwargs)
+        if any(search_kwargs.get(option) for option in self.UNCACHED_OPTIONS):
+            super().run(spelling_query, **kwargs)
+            return
+        key = self.get_result_cache_key(search_kwargs)
+        cached = get_cached_results(key)
+        if cached is None:
+            super().run(spelling_query, **kwargs)
+            set_cached_results(key, (
+                tuple(
+                    (result.app_label, result.model_name, result.pk,
+                     result.score, result.get_additional_fields())
+                    for result in self._results
+                ),
+                self._hit_count,
+                self._spelling_suggestion
+            ))
+            return
+        results, self._hit_count, self._spelling_suggestion = cached
+        result_class = search_kwargs.get('result_class') or SearchResult
+        self._results = [
+            result_class(app_label, model_name, pk, score, **fields)
+            for app_label, model_name, pk, score, fields in results
+        ]
+        self._facet_counts = {}
+
+    def get_result_cache_key(self, search_kwargs):
+        lang_code = get_alias_language(self._using)
+        options = sorted(
+            (option, repr(value))
+            for option, value in search_kwargs.items()
+            if option not in (
+                'start_offset', 'end_offset', 'models', 'result_class'
+            )
+        )
+        return (
+            lang_code,
+            get_index_generation(lang_code),
+            ' '.join(self.build_query().split()),
+            search_kwargs.get('start_offset', 0),
+            search_kwargs.get('end_offset'),
+            tuple(sorted(
+                model._meta.label
+                for model in search_kwargs.get('models', ())
+            )),
+            tuple(options)
+        )
+
 
 class MultilingualWhooshEngine(WhooshEngine):
     backend = MultilingualWhooshSearchBackend
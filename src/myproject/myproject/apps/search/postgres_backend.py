@@ -0,0 +1,206 @@
+"""
+Haystack engine searching the ideas with PostgreSQL full-text search
+instead of the Whoosh indexes. The text of each object is stored in
+SearchDocument with a tsvector of each language under a GIN index,
+written in the same transaction as the changes of the object.
+The database must use the UTF8 encoding, otherwise the text search
+parser doesn't find the words of non-Latin languages like Russian.
+
+To use it, make it the default connection in the settings:
+
+    HAYSTACK_CONNECTIONS['default'] = {
+        'ENGINE': 'myproject.apps.search.postgres_backend.PostgresSearchEngine'
+    }
+"""
+from django.apps import apps
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector
+)
+from django.db import transaction
+from django.db.models import F, FloatField, Value
+from django.utils import translation
+from haystack import connections
+from haystack.backends import (
+    BaseEngine,
+    BaseSearchBackend,
+    BaseSearchQuery,
+    SearchNode,
+    log_query
+)
+from haystack.exceptions import SkipDocument
+from haystack.inputs import PythonData
+from haystack.models import SearchResult
+from haystack.utils import get_identifier
+
+from .app_settings import TEXT_SEARCH_CONFIGS
+from .models import SearchDocument
+from .multilingual_whoosh_backend import get_chunks
+
+
+def get_text_search_config(lang_code):
+    return TEXT_SEARCH_CONFIGS.get(lang_code, 'simple')
+
+
+class WebSearchQuery(SearchQuery):
+    """
+    SearchQuery parsed by websearch_to_tsquery() of PostgreSQL 11,
+    which accepts any user input: words, "quoted phrases",
+    -excluded words and "or".
+    """
+    SEARCH_TYPES = {
+        **SearchQuery.SEARCH_TYPES,
+        'websearch': 'websearch_to_tsquery'
+    }
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    # Nothing needs escaping for websearch_to_tsquery()
+    RESERVED_WORDS = ()
+    RESERVED_CHARACTERS = ()
+    # The search documents are written in the transaction of the
+    # changed objects instead of being queued, see index_queue
+    updates_in_transaction = True
+
+    def update(self, index, iterable, commit=True):
+        model_label = index.get_model()._meta.label
+        content_field = index.get_content_field()
+        for chunk in get_chunks(index, iterable):
+            documents = []
+            for obj in chunk:
+                document = SearchDocument(
+                    model_label=model_label,
+                    object_pk=str(obj.pk)
+                )
+                try:
+                    for lang_code, lang_name in settings.LANGUAGES:
+                        with translation.override(lang_code):
+                            prepared_data = index.full_prepare(obj)
+                        setattr(
+                            document,
+                            SearchDocument.text_field_name(lang_code),
+                            prepared_data[content_field]
+                        )
+                except SkipDocument:
+                    self.log.debug('Indexing for object `%s` skipped', obj)
+                else:
+                    documents.append(document)
+            pks = [str(obj.pk) for obj in chunk]
+            with transaction.atomic():
+                SearchDocument.objects.filter(
+                    model_label=model_label,
+                    object_pk__in=pks
+                ).delete()
+                SearchDocument.objects.bulk_create(documents)
+                # the vectors of all languages with one statement
+                SearchDocument.objects.filter(
+                    model_label=model_label,
+                    object_pk__in=pks
+                ).update(**{
+                    SearchDocument.vector_field_name(lang_code): SearchVector(
+                        SearchDocument.text_field_name(lang_code),
+                        config=get_text_search_config(lang_code)
+                    )
+                    for lang_code, lang_name in settings.LANGUAGES
+                })
+
+    def remove(self, obj_or_string, commit=True):
+        app_label, model_name, pk = get_identifier(obj_or_string).split('.')
+        SearchDocument.objects.filter(
+            model_label=apps.get_model(app_label, model_name)._meta.label,
+            object_pk=pk
+        ).delete()
+
+    def clear(self, models=None, commit=True):
+        documents = SearchDocument.objects.all()
+        if models is not None:
+            documents = documents.filter(
+                model_label__in=[model._meta.label for model in models]
+            )
+        documents.delete()
+
+    @log_query
+    def search(self, query_string, start_offset=0, end_offset=None,
+               models=None, result_class=None, **kwargs):
+        if models is None:
+            models = connections[
+                self.connection_alias
+            ].get_unified_index().get_indexed_models()
+        lang_code = translation.get_language() or settings.LANGUAGE_CODE
+        vector_field = SearchDocument.vector_field_name(lang_code)
+        documents = SearchDocument.objects.filter(
+            model_label__in=[model._meta.label for model in models]
+        )
+        if query_string:
+            query = WebSearchQuery(
+                query_string,
+                config=get_text_search_config(lang_code),
+                search_type='websearch'
+            )
+            # matched with the GIN index of the language
+            documents = documents.filter(**{vector_field: query}).annotate(
+                score=SearchRank(F(vector_field), query)
+            ).order_by('-score', 'pk')
+        else:
+            documents = documents.annotate(
+                score=Value(0, output_field=FloatField())
+            ).order_by('pk')
+        hits = documents.count()
+        result_class = result_class or SearchResult
+        results = []
+        for model_label, object_pk, score in documents.values_list(
+            'model_label', 'object_pk', 'score'
+        )[start_offset:end_offset]:
+            model = apps.get_model(model_label)
+            results.append(result_class(
+                model._meta.app_label, model._meta.model_name, object_pk, score
+            ))
+        return {
+            'results': results,
+            'hits': hits
+        }
+
+
+class PostgresSearchQuery(BaseSearchQuery):
+    """
+    Builds the query for websearch_to_tsquery() from the filters
+    of the document field.
+    """
+
+    def build_query(self):
+        if not self.query_filter:
+            return self.matching_all_fragment()
+        return self._build_sub_query(self.query_filter)
+
+    def _build_sub_query(self, search_node):
+        term_list = []
+        for child in search_node.children:
+            if isinstance(child, SearchNode):
+                term_list.append(self._build_sub_query(child))
+            else:
+                value = child[1]
+                if not hasattr(value, 'input_type_name'):
+                    value = PythonData(value)
+                term_list.append(str(value.prepare(self)))
+        if search_node.negated:
+            term_list = [self.build_not_query(term) for term in term_list]
+        connector = ' or ' if search_node.connector == SearchNode.OR else ' '
+        return connector.join(term for term in term_list if term)
+
+    def matching_all_fragment(self):
+        return ''
+
+    def build_exact_query(self, query_string):
+        return f'"{query_string}"'
+
+    def build_not_query(self, query_string):
+        if ' ' in query_string:
+            query_string = f'"{query_string}"'
+        return f'-{query_string}'
+
+
+class PostgresSearchEngine(BaseEngine):
+    backend = PostgresSearchBackend
+    query = PostgresSearchQuery
@@ -1,5 +1,10 @@
+from django.conf import settings
+from django.db import models
+from django.utils.translation import get_language
 from haystack import indexes
 
+from myproject.apps.categories.models import Category
+from myproject.apps.core.model_field import TranslatedField
 from myproject.apps.ideas.models import IdeaWithTranslatedFields
 
 
@@ -9,9 +14,42 @@ class IdeaIndex(indexes.SearchIndex, indexes.Indexable):
     def get_model(self):
         return IdeaWithTranslatedFields
 
+    def get_prefetch_lookups(self):
+        """
+        The related objects read by prepare_text(): the translations of
+        all languages and the categories with their translations.
+        """
+        return [
+            'translations',
+            models.Prefetch(
+                'categories',
+                queryset=Category.objects.prefetch_related('translations')
+            )
+        ]
+
     def index_queryset(self, using=None):
         """Used when the entire index for model is updated."""
-        return self.get_model().objects.all()
+        return self.get_model().objects.prefetch_related(
+            *self.get_prefetch_lookups()
+        )
+
+    def read_queryset(self, using=None):
+        """
+        Used to load the ideas of a page of search results at once,
+        with the translations of the active language and the categories,
+        whose titles are read from the cached title map.
+        """
+        return self.get_model().objects.with_translations().prefetch_related(
+            'categories'
+        )
+
+    def prefetch_batch(self, ideas):
+        """
+        Loads the related objects of a batch of ideas with a few
+        queries, unless they are prefetched already, so that the ideas
+        can be prepared for each language without further queries.
+        """
+        models.prefetch_related_objects(ideas, *self.get_prefetch_lookups())
 
     def prepare_text(self, idea):
         """Called for each language / backend."""
@@ -20,6 +58,23 @@ class IdeaIndex(indexes.SearchIndex, indexes.Indexable):
             idea.translated_content
         ]
         fields += [
-            category.translated_title for category in idea.categories.all()
+            self.get_category_title(category)
+            for category in idea.categories.all()
         ]
         return '\n'.join(fields)
+
+    @staticmethod
+    def get_category_title(category):
+        """
+        Returns the category title in the active language from the
+        prefetched translations rather than from the cached title map,
+        which isn't invalidated yet when a category change is indexed
+        in the same transaction.
+        """
+        lang_code = get_language()
+        if lang_code == settings.LANGUAGE_CODE:
+            return category.title
+        category_translation = TranslatedField.get_translation(
+            category, lang_code
+        )
+        return (category_translation or category).title
@@ -0,0 +1,91 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete
+)
+from haystack.signals import BaseSignalProcessor
+
+from .index_queue import queue_for_indexing
+
+
+class QueuedSignalProcessor(BaseSignalProcessor):
+    """
+    Queues the ideas whose indexed text changes, instead of updating
+    the search indexes during the request. The queue is flushed in
+    batches by index_queue.flush_index_queue().
+    """
+
+    def setup(self):
+        from myproject.apps.categories.models import (
+            Category,
+            CategoryTranslations
+        )
+        from myproject.apps.ideas.models import (
+            IdeaTranslations,
+            IdeaWithTranslatedFields
+        )
+
+        self.idea_model = IdeaWithTranslatedFields
+        self.category_model = Category
+        self.receivers = [
+            (post_save, self.handle_idea, IdeaWithTranslatedFields),
+            (post_delete, self.handle_idea, IdeaWithTranslatedFields),
+            (post_save, self.handle_translation, IdeaTranslations),
+            (post_delete, self.handle_translation, IdeaTranslations),
+            (
+                m2m_changed,
+                self.handle_categories,
+                IdeaWithTranslatedFields.categories.through
+            ),
+            # the category titles are a part of the indexed text
+            (post_save, self.handle_category, Category),
+            # before the deletion cascades to the idea-category rows,
+            # which doesn't send m2m_changed
+            (pre_delete, self.handle_category, Category),
+            (post_save, self.handle_category, CategoryTranslations),
+            (post_delete, self.handle_category, CategoryTranslations),
+        ]
+        for signal, receiver, sender in self.receivers:
+            signal.connect(receiver, sender=sender)
+
+    def teardown(self):
+        for signal, receiver, sender in self.receivers:
+            signal.disconnect(receiver, sender=sender)
+
+    def handle_idea(self, sender, instance, **kwargs):
+        queue_for_indexing(self.idea_model, [instance.pk])
+
+    def handle_translation(self, sender, instance, **kwargs):
+        queue_for_indexing(self.idea_model, [instance.idea_id])
+
+    def handle_categories(self, sender, instance, action, reverse,
+                          pk_set, **kwargs):
+        if not reverse:
+            # instance is an idea
+            if action.startswith('post_'):
+                queue_for_indexing(self.idea_model, [instance.pk])
+        elif action == 'pre_clear':
+            # instance is a category, whose ideas are unknown after clearing
+            instance._cleared_idea_pks = list(
+                instance.category_ideas.values_list('pk', flat=True)
+            )
+        elif action == 'post_clear':
+            queue_for_indexing(
+                self.idea_model,
+                instance.__dict__.pop('_cleared_idea_pks', [])
+            )
+        elif action in ('post_add', 'post_remove'):
+            queue_for_indexing(self.idea_model, pk_set)
+
+    def handle_category(self, sender, instance, **kwargs):
+        category_id = (
+            instance.pk if sender is self.category_model
+            else instance.category_id
+        )
+        queue_for_indexing(
+            self.idea_model,
+            self.idea_model.objects.filter(
+                categories=category_id
+            ).values_list('pk', flat=True)
+        )
@@ -1,3 +1,31 @@
 from django.test import TestCase
 
-# Create your tests here.
+from myproject.apps.categories.models import Category
+from myproject.apps.ideas.models import IdeaWithTranslatedFields
+from .models import IndexQueueItem
+
+
+class QueuedSignalProcessorTest(TestCase):
+    def test_category_deletion_queues_its_ideas(self):
+        category = Category.objects.create(title='Travel', slug='travel')
+        ideas = [
+            IdeaWithTranslatedFields.objects.create(
+                title=f'Idea {index}',
+                content='Content'
+            )
+            for index in range(2)
+        ]
+        for idea in ideas:
+            idea.categories.add(category)
+        IdeaWithTranslatedFields.objects.create(
+            title='Idea without the category',
+            content='Content'
+        )
+        IndexQueueItem.objects.all().delete()
+
+        category.delete()
+
+        self.assertEqual(
+            set(IndexQueueItem.objects.values_list('object_pk', flat=True)),
+            {str(idea.pk) for idea in ideas}
+        )
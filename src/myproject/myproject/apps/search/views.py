@@ -1,3 +1,51 @@
-from django.shortcuts import render
+from django.utils.translation import get_language
+from haystack.views import SearchView
 
-# Create your views here.
+from myproject.apps.ideas.app_settings import USE_READ_MODEL
+from myproject.apps.ideas.models import LocalizedIdea
+from myproject.apps.ideas.pictures import (
+    resolve_picture_urls,
+    with_variants
+)
+
+
+class IdeaSearchView(SearchView):
+    """
+    Search view setting the idea to render as result.idea
+    for each result of the page.
+    """
+    use_read_model = USE_READ_MODEL
+
+    def __init__(self, *args, **kwargs):
+        if self.use_read_model:
+            # The ideas themselves are not needed
+            kwargs.setdefault('load_all', False)
+        super().__init__(*args, **kwargs)
+
+    def build_page(self):
+        paginator, page = super().build_page()
+        results = list(page.object_list)
+        if self.use_read_model:
+            localized_ideas = LocalizedIdea.objects.filter(
+                language=get_language(),
+                idea__in=[result.pk for result in results]
+            )
+            ideas = {
+                str(localized_idea.idea_id): localized_idea
+                for localized_idea in localized_ideas
+            }
+            for result in results:
+                result.idea = ideas.get(str(result.pk))
+        else:
+            # loaded for the whole page in the order of the hits
+            # with IdeaIndex.read_queryset()
+            for result in results:
+                result.idea = result.object
+            resolve_picture_urls(
+                [result.idea for result in results if result.idea],
+                specs=with_variants('picture_thumbnail')
+            )
+        page.object_list = [
+            result for result in results if result.idea is not None
+        ]
+        return paginator, page
@@ -121,6 +121,17 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/3.0/topics/cache/
+# The file-based cache is shared by all the gunicorn workers of a container
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'tmp', 'cache'),
+    }
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
 
@@ -183,6 +194,10 @@ for lang_code, lang_name in LANGUAGES:
         f'default_{lang_code_underscored}'
     ]
 
+HAYSTACK_SIGNAL_PROCESSOR = (
+    'myproject.apps.search.signals.QueuedSignalProcessor'
+)
+
 TIME_ZONE = 'UTC'
 
 USE_I18N = True
@@ -21,6 +21,7 @@ from django.urls import include, path
 from django.views.generic import TemplateView
 
 from myproject.apps.ideas.views import idea_detail_view
+from myproject.apps.search.views import IdeaSearchView
 
 urlpatterns = i18n_patterns(
     path('', TemplateView.as_view(template_name="index.html")),
@@ -37,7 +38,7 @@ urlpatterns = i18n_patterns(
             namespace='ideas'
         )
     ),
-    path('search/', include('haystack.urls'))
+    path('search/', IdeaSearchView(), name='haystack_search')
 )
 
 urlpatterns += static(